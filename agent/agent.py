@@ -8,12 +8,14 @@ coding agent in the Darwin Gödel Machine system.
 import ast
 import asyncio
 import copy
+import functools
 import hashlib
 import json
 import logging
 import re
+import time
 import uuid
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 import yaml
@@ -32,6 +34,68 @@ from .tools.base_tool import BaseTool, ToolRegistry, ToolResult, ToolExecutionSt
 from .tools.bash_tool import BashTool
 from .tools.edit_tool import EditTool
 
+# Markdown code block: ```python or ``` followed by code and a closing ```.
+_CODE_BLOCK_RE = re.compile(r'```(?:python)?\s*\n(.*?)\n\s*```', re.DOTALL)
+# Line prefixes that start a code block when no markdown fence is present.
+_CODE_START_PREFIXES = ('def ', 'class ', 'import ', 'from ', 'async def ')
+# First characters of those prefixes; most prose lines fail this cheap check.
+_CODE_START_CHARS = frozenset(prefix[0] for prefix in _CODE_START_PREFIXES)
+# Files modified more recently than this are re-hashed on every snapshot.
+_CODE_HASH_RACE_WINDOW_NS = 2_000_000_000
+# Public stdin examples in benchmark task descriptions.
+_STDIN_EXAMPLE_RE = re.compile(r"\s*\d+\.\s+Stdin:\s*$")
+_EXPECTED_STDOUT_RE = re.compile(r"\s*Expected stdout:\s*$")
+_READS_STDIN_RE = re.compile(r"\s*\d+\.\s+Program reads stdin")
+_HEREDOC_STDIN_RE = re.compile(
+    r"<<\s*['\"]?([A-Za-z_][A-Za-z0-9_-]*)['\"]?\s*\n(.*?)\n\1(?:\s|$)",
+    re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_stdin_examples(description: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse (stdin, expected stdout) pairs from a task description.
+
+    Cached by description because the agent re-checks the same task's
+    examples on every step and bash call.
+    """
+    examples: List[Tuple[str, str]] = []
+    lines = description.splitlines()
+    index = 0
+    while index < len(lines):
+        if not _STDIN_EXAMPLE_RE.match(lines[index]):
+            index += 1
+            continue
+
+        index += 1
+        input_lines: List[str] = []
+        while index < len(lines) and not _EXPECTED_STDOUT_RE.match(lines[index]):
+            input_lines.append(lines[index])
+            index += 1
+
+        if index >= len(lines):
+            break
+
+        index += 1
+        expected_lines: List[str] = []
+        while index < len(lines):
+            line = lines[index]
+            if _STDIN_EXAMPLE_RE.match(line):
+                break
+            if _READS_STDIN_RE.match(line):
+                break
+            if line.strip() == "Focus on the requested behavior and the examples above.":
+                break
+            expected_lines.append(line)
+            index += 1
+
+        raw_input = "\n".join(input_lines).strip()
+        raw_expected = "\n".join(expected_lines).strip()
+        if raw_input:
+            examples.append((raw_input, raw_expected))
+
+    return tuple(examples)
+
 
 @dataclass
 class Task:
@@ -106,6 +170,8 @@ class Agent:
         self.current_task: Optional[Task] = None
         self._self_modification_read_observed = False
         self._self_modification_write_observed = False
+        # Agent-code file hashes keyed by path: (stat signature, sha256 hex)
+        self._code_hash_cache: Dict[Path, Any] = {}
         
         # Agent metadata
         self.generation = 0  # Which generation this agent is (0 = seed)
@@ -804,13 +870,28 @@ class Agent:
             if not self._is_agent_code_relative_path(relative_path):
                 continue
             try:
-                content = path.read_bytes()
+                digest = self._hash_agent_code_file(path)
             except OSError as exc:
                 logger.debug("Could not snapshot %s: %s", path, exc)
                 continue
-            snapshot[relative_path.as_posix()] = hashlib.sha256(content).hexdigest()
+            snapshot[relative_path.as_posix()] = digest
         return snapshot
 
+    def _hash_agent_code_file(self, path: Path) -> str:
+        """Return a file's sha256, reusing the last hash while its stat is unchanged."""
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self._code_hash_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        # As with git's racy-index check, only trust the stat signature later
+        # if the file was already older than any mtime granularity when hashed;
+        # a same-tick rewrite could otherwise keep an identical signature.
+        if time.time_ns() - stat.st_mtime_ns > _CODE_HASH_RACE_WINDOW_NS:
+            self._code_hash_cache[path] = (signature, digest)
+        return digest
+
     def _has_agent_code_changes(self, before_snapshot: Dict[str, str]) -> bool:
         return self._snapshot_agent_code_files() != before_snapshot
 
@@ -963,49 +1044,7 @@ class Agent:
         """Extract public stdin examples from a benchmark task description."""
         if task is None or not task.description:
             return {}
-
-        expectations: Dict[str, str] = {}
-        lines = task.description.splitlines()
-        index = 0
-        while index < len(lines):
-            if not re.match(r"\s*\d+\.\s+Stdin:\s*$", lines[index]):
-                index += 1
-                continue
-
-            index += 1
-            input_lines: List[str] = []
-            while index < len(lines) and not re.match(
-                r"\s*Expected stdout:\s*$",
-                lines[index],
-            ):
-                input_lines.append(lines[index])
-                index += 1
-
-            if index >= len(lines):
-                break
-
-            index += 1
-            expected_lines: List[str] = []
-            while index < len(lines):
-                line = lines[index]
-                if re.match(r"\s*\d+\.\s+Stdin:\s*$", line):
-                    break
-                if re.match(r"\s*\d+\.\s+Program reads stdin", line):
-                    break
-                if (
-                    line.strip()
-                    == "Focus on the requested behavior and the examples above."
-                ):
-                    break
-                expected_lines.append(line)
-                index += 1
-
-            raw_input = "\n".join(input_lines).strip()
-            raw_expected = "\n".join(expected_lines).strip()
-            if raw_input:
-                expectations[raw_input] = raw_expected
-
-        return expectations
+        return dict(_parse_stdin_examples(task.description))
 
     @classmethod
     def _task_has_stdin_example_expectations(cls, task: Optional[Task]) -> bool:
@@ -1014,11 +1053,7 @@ class Agent:
     @staticmethod
     def _extract_heredoc_stdin(command: str) -> Optional[str]:
         """Return stdin supplied via a shell heredoc, when parseable."""
-        match = re.search(
-            r"<<\s*['\"]?([A-Za-z_][A-Za-z0-9_-]*)['\"]?\s*\n(.*?)\n\1(?:\s|$)",
-            command,
-            re.DOTALL,
-        )
+        match = _HEREDOC_STDIN_RE.search(command)
         if not match:
             return None
         return match.group(2).strip()
@@ -1898,45 +1933,53 @@ Always be precise, methodical, and thorough in your work."""
         Returns:
             Extracted Python code
         """
-        import re
-        
         # Extract code from markdown code blocks
-        # Pattern matches ```python or ``` followed by code and closing ```
-        # More flexible pattern to handle various formatting
-        code_block_pattern = r'```(?:python)?\s*\n(.*?)\n\s*```'
-        matches = re.findall(code_block_pattern, response, re.DOTALL)
-        
-        if matches:
-            # Return the last code block (likely the final solution)
-            code = matches[-1].strip()
-            logger.info(f"Extracted code from markdown block: {len(code)} characters")
-            return code
+        if '```' in response:
+            # The last code block is likely the final solution, so try the
+            # last fence pair first. That pair is only a block when its first
+            # fence opens one (an even number of fences precede it); with an
+            # odd count, e.g. a truncated final block, or when the pair is not
+            # well-formed, scan the whole response instead.
+            end = response.rfind('```')
+            start = response.rfind('```', 0, end)
+            match = None
+            if start != -1 and response.count('```', 0, start) % 2 == 0:
+                match = _CODE_BLOCK_RE.match(response, start)
+            if match is not None:
+                code = match.group(1).strip()
+            else:
+                matches = _CODE_BLOCK_RE.findall(response)
+                code = matches[-1].strip() if matches else None
+            if code is not None:
+                logger.debug("Extracted code from markdown block: %d characters", len(code))
+                return code
         
         # If no code blocks found, log warning
         logger.warning("No markdown code blocks found in response")
         
-        # As a fallback, try to find code that looks like a function definition
-        lines = response.split('\n')
-        code_lines = []
-        in_function = False
-        
-        for line in lines:
-            # Check if line starts a function
-            if line.strip().startswith(('def ', 'class ', 'import ', 'from ', 'async def ')):
-                in_function = True
-                code_lines = [line]
-            elif in_function:
-                # Continue collecting lines if they're indented or empty
-                if line.strip() == '' or line.startswith((' ', '\t')):
-                    code_lines.append(line)
-                else:
-                    # Non-indented non-empty line, function likely ended
-                    if not line.strip().startswith(('def ', 'class ', 'import ', 'from ')):
-                        break
+        # As a fallback, find code that looks like a function definition.
+        # Scan line by line in place, tracking only where the block starts
+        # and ends: a code-start line (re)opens the block, indented or blank
+        # lines extend it, and the first other line ends the scan.
+        block_start = None
+        block_end = len(response)
+        pos = 0
+        while pos <= len(response):
+            newline = response.find('\n', pos)
+            if newline == -1:
+                newline = len(response)
+            line = response[pos:newline]
+            stripped = line.strip()
+            if stripped[:1] in _CODE_START_CHARS and stripped.startswith(_CODE_START_PREFIXES):
+                block_start = pos
+            elif block_start is not None and stripped and not line.startswith((' ', '\t')):
+                block_end = pos
+                break
+            pos = newline + 1
         
-        if code_lines:
-            code = '\n'.join(code_lines).strip()
-            logger.info(f"Extracted code using fallback method: {len(code)} characters")
+        if block_start is not None:
+            code = response[block_start:block_end].strip()
+            logger.debug("Extracted code using fallback method: %d characters", len(code))
             return code
         
         # If all else fails, return empty string and log error
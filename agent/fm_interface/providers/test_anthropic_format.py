@@ -7,26 +7,14 @@ reaches the wire.  Only the pure formatting logic is exercised.
 
 Run with:
     python3 -m pytest agent/fm_interface/providers/test_anthropic_format.py -v
-or as a plain script:
-    python3 agent/fm_interface/providers/test_anthropic_format.py
+or as a plain script from the project root:
+    python3 -m agent.fm_interface.providers.test_anthropic_format
 """
 
 import sys
-import os
 import types
 import unittest
 
-# ---------------------------------------------------------------------------
-# Make sure the project root is on sys.path so imports work regardless of cwd.
-# ---------------------------------------------------------------------------
-_HERE = os.path.dirname(os.path.abspath(__file__))
-_REPO_ROOT = os.path.normpath(os.path.join(_HERE, "..", "..", "..", ".."))
-# The repo root should be darwin-godel-machine's parent; add darwin-godel-machine.
-_PROJECT = os.path.normpath(os.path.join(_HERE, "..", "..", ".."))
-for _p in (_PROJECT, _REPO_ROOT):
-    if _p not in sys.path:
-        sys.path.insert(0, _p)
-
 from agent.fm_interface.api_handler import (
     Message,
     MessageRole,
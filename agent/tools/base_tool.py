@@ -55,7 +55,10 @@ class BaseTool(ABC):
         self._name = self.get_name()
         self._description = self.get_description()
         self._parameters = self.get_parameters()
+        self._parameters_by_name = {param.name: param for param in self._parameters}
         self._timeout = self.get_timeout()
+        # Built on first request; parameters are fixed once the tool exists.
+        self._tool_schema: Optional[Dict[str, Any]] = None
     
     @abstractmethod
     def get_name(self) -> str:
@@ -120,7 +123,7 @@ class BaseTool(ABC):
             ToolResult: Success result if valid, error result if invalid
         """
         try:
-            valid_parameter_names = {param.name for param in self._parameters}
+            valid_parameter_names = self._parameters_by_name
 
             for param_name in parameters:
                 if param_name not in valid_parameter_names:
@@ -172,10 +175,15 @@ class BaseTool(ABC):
         Get the JSON schema representation of this tool.
         
         This is used by Foundation Models to understand how to call the tool.
+        The schema is built once and the same dict is returned on every call,
+        so callers that need to alter it must copy it first.
         
         Returns:
             Dict: JSON schema for the tool
         """
+        if self._tool_schema is not None:
+            return self._tool_schema
+        
         properties = {}
         required = []
         
@@ -199,7 +207,7 @@ class BaseTool(ABC):
             if param.required:
                 required.append(param.name)
         
-        return {
+        self._tool_schema = {
             "name": self._name,
             "description": self._description,
             "parameters": {
@@ -208,6 +216,7 @@ class BaseTool(ABC):
                 "required": required
             }
         }
+        return self._tool_schema
     
     def _get_parameter_definition(self, param_name: str) -> Optional[ToolParameter]:
         """
@@ -219,10 +228,7 @@ class BaseTool(ABC):
         Returns:
             ToolParameter or None if not found
         """
-        for param in self._parameters:
-            if param.name == param_name:
-                return param
-        return None
+        return self._parameters_by_name.get(param_name)
     
     def _validate_parameter_value(self, param_def: ToolParameter, value: Any) -> Optional[str]:
         """
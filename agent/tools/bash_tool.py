@@ -14,7 +14,7 @@ import signal
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import time
 
 from .base_tool import BaseTool, ToolResult, ToolExecutionStatus, ToolParameter
@@ -22,6 +22,14 @@ from .base_tool import BaseTool, ToolResult, ToolExecutionStatus, ToolParameter
 
 _BASH_PROCESS_MEMORY_LIMIT_MB = 384
 
+# Environment variable names containing any of these terms are withheld from
+# agent-run commands.
+_SENSITIVE_ENV_NAME_RE = re.compile(r"key|token|secret|password|credential")
+
+# Characters that make /bin/sh expand, redirect, chain, or escape an echo's
+# arguments; echo commands containing none of them are answered in-process.
+_ECHO_SHELL_SYNTAX_RE = re.compile(r"[$`\\|&;<>(){}\[\]*?~#!\n\r]")
+
 
 def _apply_bash_process_resource_limits() -> None:
     """Keep agent-run shell commands from exhausting the sandbox container."""
@@ -95,11 +103,10 @@ class BashTool(BaseTool):
 
     def _sanitized_environment(self) -> Dict[str, str]:
         """Return the process environment without credential-like variables."""
-        sensitive_terms = ("key", "token", "secret", "password", "credential")
         return {
             key: value
             for key, value in os.environ.items()
-            if not any(term in key.lower() for term in sensitive_terms)
+            if not _SENSITIVE_ENV_NAME_RE.search(key.lower())
         }
 
     def _can_use_sandbox(self) -> bool:
@@ -154,6 +161,15 @@ class BashTool(BaseTool):
                 description="Whether to capture and return command output",
                 required=False,
                 default=True
+            ),
+            ToolParameter(
+                name="max_output_bytes",
+                type="integer",
+                description=(
+                    "Stop the command once it has written this many bytes to "
+                    "stdout and return what was captured (default: no limit)"
+                ),
+                required=False,
             )
         ]
     
@@ -177,6 +193,7 @@ class BashTool(BaseTool):
             command = parameters["command"].strip()
             timeout = min(parameters.get("timeout", self.default_timeout), 300)  # Max 5 minutes
             capture_output = parameters.get("capture_output", True)
+            max_output_bytes = parameters.get("max_output_bytes")
             
             # Safety check for empty commands
             if not command:
@@ -185,6 +202,14 @@ class BashTool(BaseTool):
                     output="",
                     error="Command cannot be empty"
                 )
+            if max_output_bytes is not None and (
+                not isinstance(max_output_bytes, int) or max_output_bytes <= 0
+            ):
+                return ToolResult(
+                    status=ToolExecutionStatus.INVALID_PARAMS,
+                    output="",
+                    error="max_output_bytes must be a positive integer"
+                )
             
             # Parse command to check for blocked operations
             safety_check = self._check_command_safety(command)
@@ -206,14 +231,25 @@ class BashTool(BaseTool):
                     timeout,
                     capture_output,
                 )
+                if max_output_bytes is not None:
+                    encoded = result.output.encode("utf-8")
+                    if len(encoded) > max_output_bytes:
+                        result.output = encoded[:max_output_bytes].decode(
+                            "utf-8", errors="replace"
+                        )
+                        result.metadata["output_truncated"] = True
                 result.execution_time = time.time() - start_time
                 return result
 
             if first_word in self.restricted_commands:
-                return await self.restricted_commands[first_word](command, timeout)
+                return await self.restricted_commands[first_word](
+                    command, timeout, max_output_bytes
+                )
             
             # Execute the command
-            result = await self._execute_command(command, timeout, capture_output)
+            result = await self._execute_command(
+                command, timeout, capture_output, max_output_bytes
+            )
             
             execution_time = time.time() - start_time
             result.execution_time = execution_time
@@ -440,18 +476,22 @@ class BashTool(BaseTool):
         command: str,
         timeout: int,
         capture_output: bool,
+        max_output_bytes: Optional[int] = None,
     ) -> ToolResult:
         """
         Execute a shell command.
 
         The subprocess is started in its own process group (``start_new_session=True``).
         On timeout the entire process group is killed with SIGKILL so that child
-        processes spawned by ``/bin/sh`` do not leak.
+        processes spawned by ``/bin/sh`` do not leak.  The same happens when
+        ``max_output_bytes`` of stdout have been read, so a chatty command is
+        not drained to completion.
 
         Args:
             command: Command to execute
             timeout: Timeout in seconds
             capture_output: Whether to capture output
+            max_output_bytes: Optional cap on captured stdout bytes
 
         Returns:
             ToolResult: Execution result
@@ -470,14 +510,34 @@ class BashTool(BaseTool):
             process = await asyncio.create_subprocess_shell(command, **subprocess_kwargs)
 
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout,
-                )
+                output_truncated = stderr_truncated = False
+                if capture_output and max_output_bytes is not None:
+                    (
+                        stdout, stderr, output_truncated, stderr_truncated,
+                    ) = await asyncio.wait_for(
+                        self._read_capped_output(process, max_output_bytes),
+                        timeout=timeout,
+                    )
+                else:
+                    stdout, stderr = await asyncio.wait_for(
+                        process.communicate(),
+                        timeout=timeout,
+                    )
 
                 stdout_text = stdout.decode("utf-8", errors="replace") if stdout else ""
                 stderr_text = stderr.decode("utf-8", errors="replace") if stderr else ""
 
+                if output_truncated:
+                    metadata = {"exit_code": None, "output_truncated": True}
+                    if stderr_truncated:
+                        metadata["stderr_truncated"] = True
+                    return ToolResult(
+                        status=ToolExecutionStatus.SUCCESS,
+                        output=stdout_text,
+                        error=stderr_text if stderr_text else None,
+                        metadata=metadata,
+                    )
+
                 if process.returncode == 0:
                     status = ToolExecutionStatus.SUCCESS
                     output = stdout_text
@@ -487,20 +547,19 @@ class BashTool(BaseTool):
                     output = stdout_text
                     error = f"Command failed with exit code {process.returncode}: {stderr_text}"
 
+                metadata = {"exit_code": process.returncode}
+                if stderr_truncated:
+                    metadata["stderr_truncated"] = True
                 return ToolResult(
                     status=status,
                     output=output,
                     error=error,
-                    metadata={"exit_code": process.returncode},
+                    metadata=metadata,
                 )
 
             except asyncio.TimeoutError:
                 # Kill the entire process group so child processes don't leak.
-                try:
-                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                except ProcessLookupError:
-                    pass  # Process already exited.
-                await process.wait()
+                await self._kill_process_group(process)
 
                 return ToolResult(
                     status=ToolExecutionStatus.TIMEOUT,
@@ -515,6 +574,70 @@ class BashTool(BaseTool):
                 error=f"Failed to execute command: {str(e)}",
             )
     
+    @staticmethod
+    async def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+        """SIGKILL a command's process group and reap the shell."""
+        try:
+            os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # Process already exited.
+        await process.wait()
+
+    async def _read_capped_output(
+        self,
+        process: asyncio.subprocess.Process,
+        max_output_bytes: int,
+    ) -> Tuple[bytes, bytes, bool, bool]:
+        """
+        Read stdout until EOF or ``max_output_bytes``, draining stderr alongside.
+
+        When stdout reaches the cap the process group is killed and the
+        captured prefix is returned with ``stdout_truncated`` set. stderr keeps
+        at most ``max_output_bytes`` too, but is drained (and the excess
+        discarded) to EOF so a chatty stderr never blocks the child on a full
+        pipe.
+
+        Returns:
+            Tuple of (stdout, stderr, stdout_truncated, stderr_truncated)
+        """
+        async def read_stream(
+            stream: asyncio.StreamReader, limit: int, drain: bool
+        ) -> Tuple[bytes, bool]:
+            chunks = []
+            size = 0
+            while size < limit:
+                chunk = await stream.read(limit - size)
+                if not chunk:
+                    return b"".join(chunks), False
+                chunks.append(chunk)
+                size += len(chunk)
+            # Output of exactly ``limit`` bytes is not truncated; only a
+            # further byte before EOF is.
+            truncated = False
+            if drain:
+                while await stream.read(65536):
+                    truncated = True
+            else:
+                truncated = bool(await stream.read(1))
+            return b"".join(chunks), truncated
+
+        stderr_task = asyncio.ensure_future(
+            read_stream(process.stderr, max_output_bytes, drain=True)
+        )
+        try:
+            stdout, stdout_truncated = await read_stream(
+                process.stdout, max_output_bytes, drain=False
+            )
+            if stdout_truncated:
+                await self._kill_process_group(process)
+            stderr, stderr_truncated = await stderr_task
+        finally:
+            # On timeout the caller cancels us; don't leave the reader pending.
+            stderr_task.cancel()
+        if not stdout_truncated:
+            await process.wait()
+        return stdout, stderr, stdout_truncated, stderr_truncated
+
     # Special command handlers
     
     async def _handle_cd(self, command: str, timeout: int) -> ToolResult:
@@ -570,16 +693,66 @@ class BashTool(BaseTool):
             output=self.working_directory
         )
     
-    async def _handle_ls(self, command: str, timeout: int) -> ToolResult:
+    async def _handle_ls(
+        self,
+        command: str,
+        timeout: int,
+        max_output_bytes: Optional[int] = None,
+    ) -> ToolResult:
         """Handle ls command safely."""
         # Use the actual ls command but ensure we're in our working directory
-        return await self._execute_command(command, timeout, True)
+        return await self._execute_command(command, timeout, True, max_output_bytes)
     
-    async def _handle_cat(self, command: str, timeout: int) -> ToolResult:
+    async def _handle_cat(
+        self,
+        command: str,
+        timeout: int,
+        max_output_bytes: Optional[int] = None,
+    ) -> ToolResult:
         """Handle cat command with size limits."""
         # Use the actual cat command but we could add file size checks here
-        return await self._execute_command(command, timeout, True)
+        return await self._execute_command(command, timeout, True, max_output_bytes)
     
-    async def _handle_echo(self, command: str, timeout: int) -> ToolResult:
-        """Handle echo command."""
-        return await self._execute_command(command, timeout, True)
+    async def _handle_echo(
+        self,
+        command: str,
+        timeout: int,
+        max_output_bytes: Optional[int] = None,
+    ) -> ToolResult:
+        """Handle echo command.
+
+        An echo of plain literal words is answered in-process, skipping the
+        shell spawn; anything the shell would expand, redirect, or treat as
+        an option or escape still runs through ``/bin/sh``.
+        """
+        words = self._literal_echo_words(command)
+        if words is None:
+            return await self._execute_command(command, timeout, True, max_output_bytes)
+
+        encoded = (" ".join(words) + "\n").encode("utf-8")
+        if max_output_bytes is not None and len(encoded) > max_output_bytes:
+            return ToolResult(
+                status=ToolExecutionStatus.SUCCESS,
+                output=encoded[:max_output_bytes].decode("utf-8", errors="replace"),
+                metadata={"exit_code": None, "output_truncated": True},
+            )
+        return ToolResult(
+            status=ToolExecutionStatus.SUCCESS,
+            output=encoded.decode("utf-8"),
+            metadata={"exit_code": 0},
+        )
+
+    @staticmethod
+    def _literal_echo_words(command: str) -> Optional[List[str]]:
+        """Return echo's arguments if the shell would print them verbatim, else None."""
+        if _ECHO_SHELL_SYNTAX_RE.search(command):
+            return None
+        try:
+            words = shlex.split(command)
+        except ValueError:
+            return None
+        if not words or words[0] != "echo":
+            return None
+        if len(words) > 1 and words[1].startswith("-"):
+            return None  # -n / -e style options differ between shells
+        return words[1:]
@@ -591,9 +591,12 @@ class EditTool(BaseTool):
                     )
 
                 current_content = full_path.read_text(encoding="utf-8")
-                occurrences = current_content.count(search_text)
+                # Locate the match and look past it for a second one, so the
+                # file is scanned once on the common (unique) path.
+                start = current_content.find(search_text)
+                end = start + len(search_text)
 
-                if occurrences == 0:
+                if start == -1:
                     return ToolResult(
                         status=ToolExecutionStatus.ERROR,
                         output="",
@@ -605,7 +608,8 @@ class EditTool(BaseTool):
                         ),
                     )
 
-                if occurrences > 1:
+                if current_content.find(search_text, end) != -1:
+                    occurrences = current_content.count(search_text)
                     return ToolResult(
                         status=ToolExecutionStatus.ERROR,
                         output="",
@@ -617,7 +621,9 @@ class EditTool(BaseTool):
                     )
 
                 # Exactly one occurrence — safe to replace.
-                new_content = current_content.replace(search_text, replace_text, 1)
+                new_content = (
+                    current_content[:start] + replace_text + current_content[end:]
+                )
                 python_error = self._validate_python_content(
                     file_path_str,
                     new_content,
@@ -5,21 +5,30 @@ Manages the collection of all discovered agents, their metadata,
 performance scores, and lineage information.
 """
 
+import heapq
 import json
 import os
 import shutil
 import tempfile
 import uuid
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
 
+# orjson is optional; archive metadata is parsed with it when installed. Saving
+# stays on stdlib json so the on-disk format does not depend on it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArchivedAgent:
     """Represents an agent stored in the archive."""
     
@@ -34,8 +43,12 @@ class ArchivedAgent:
     metadata: Dict[str, Any]
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return asdict(self)
+        """Convert to dictionary for serialization.
+        
+        The dict is shallow: ``benchmark_scores`` and ``metadata`` are the
+        agent's own objects, not the deep copies ``asdict`` would make.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ArchivedAgent':
@@ -63,10 +76,20 @@ class AgentArchive:
         """Load existing archive from disk."""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    data = json.load(f)
-                    for agent_id, agent_data in data.get('agents', {}).items():
-                        self.agents[agent_id] = ArchivedAgent.from_dict(agent_data)
+                with open(self.metadata_file, 'rb') as f:
+                    raw = f.read()
+                data = None
+                if orjson is not None:
+                    try:
+                        data = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # Archives written by stdlib json may hold NaN/Infinity
+                        # tokens, which orjson rejects.
+                        data = None
+                if data is None:
+                    data = json.loads(raw)
+                for agent_id, agent_data in data.get('agents', {}).items():
+                    self.agents[agent_id] = ArchivedAgent.from_dict(agent_data)
                 logger.info(f"Loaded {len(self.agents)} agents from archive")
             except Exception as e:
                 logger.error(f"Failed to load archive: {e}")
@@ -86,8 +109,9 @@ class AgentArchive:
             dir_ = self.metadata_file.parent
             fd, tmp_path = tempfile.mkstemp(dir=str(dir_), suffix='.tmp')
             try:
-                with os.fdopen(fd, 'w') as f:
-                    json.dump(data, f, indent=2)
+                payload = json.dumps(data, indent=2).encode()
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
                 os.replace(tmp_path, self.metadata_file)
             except Exception:
                 # Clean up temp file on failure
@@ -121,6 +145,41 @@ class AgentArchive:
         Returns:
             The archived agent
         """
+        agent = self._archive_agent(
+            agent_path,
+            parent_id=parent_id,
+            benchmark_scores=benchmark_scores,
+            is_valid=is_valid,
+            metadata=metadata,
+        )
+        self._save_archive()
+        return agent
+    
+    def add_agents(self, entries: List[Dict[str, Any]]) -> List[ArchivedAgent]:
+        """
+        Add several agents, writing the archive metadata once at the end.
+        
+        Args:
+            entries: One dict per agent holding ``add_agent`` keyword
+                arguments (``agent_path`` is required)
+            
+        Returns:
+            The archived agents, in the order given
+        """
+        agents = [self._archive_agent(**entry) for entry in entries]
+        if agents:
+            self._save_archive()
+        return agents
+    
+    def _archive_agent(
+        self,
+        agent_path: str,
+        parent_id: Optional[str] = None,
+        benchmark_scores: Optional[Dict[str, float]] = None,
+        is_valid: bool = True,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> ArchivedAgent:
+        """Copy an agent into the archive and register it without saving metadata."""
         agent_id = str(uuid.uuid4())
         
         # Determine generation
@@ -171,7 +230,6 @@ class AgentArchive:
         )
         
         self.agents[agent_id] = agent
-        self._save_archive()
         
         logger.info(f"Added agent {agent_id} to archive (gen {generation}, score: {average_score:.2f})")
         return agent
@@ -190,8 +248,12 @@ class AgentArchive:
     
     def get_top_agents(self, n: int = 10) -> List[ArchivedAgent]:
         """Get top N agents by average score."""
-        valid_agents = self.get_valid_agents()
-        return sorted(valid_agents, key=lambda a: a.average_score, reverse=True)[:n]
+        # Bounded heap: same result and tie order as a full descending sort.
+        return heapq.nlargest(
+            n,
+            (agent for agent in self.agents.values() if agent.is_valid),
+            key=attrgetter('average_score'),
+        )
     
     def get_agent_children(self, agent_id: str) -> List[ArchivedAgent]:
         """Get all children of a specific agent."""
@@ -204,26 +266,44 @@ class AgentArchive:
         """Get the full lineage of an agent (ancestors)."""
         lineage = []
         current_id = agent_id
+        agents = self.agents
         
         while current_id:
-            agent = self.get_agent(current_id)
+            agent = agents.get(current_id)
             if not agent:
                 break
             lineage.append(agent)
             current_id = agent.parent_id
         
-        return list(reversed(lineage))
+        lineage.reverse()
+        return lineage
     
     def get_archive_statistics(self) -> Dict[str, Any]:
-        """Get statistics about the archive."""
-        valid_agents = self.get_valid_agents()
-        all_scores = [a.average_score for a in valid_agents]
+        """Get statistics about the archive in a single pass over the agents."""
+        valid_count = 0
+        score_sum = 0.0
+        best_score = worst_score = 0
+        max_generation = 0
+        for agent in self.agents.values():
+            if agent.generation > max_generation:
+                max_generation = agent.generation
+            if not agent.is_valid:
+                continue
+            score = agent.average_score
+            if valid_count == 0:
+                best_score = worst_score = score
+            elif score > best_score:
+                best_score = score
+            elif score < worst_score:
+                worst_score = score
+            score_sum += score
+            valid_count += 1
         
         return {
             'total_agents': len(self.agents),
-            'valid_agents': len(valid_agents),
-            'average_score': sum(all_scores) / len(all_scores) if all_scores else 0,
-            'best_score': max(all_scores) if all_scores else 0,
-            'worst_score': min(all_scores) if all_scores else 0,
-            'max_generation': max((a.generation for a in self.agents.values()), default=0)
+            'valid_agents': valid_count,
+            'average_score': score_sum / valid_count if valid_count else 0,
+            'best_score': best_score,
+            'worst_score': worst_score,
+            'max_generation': max_generation
         }
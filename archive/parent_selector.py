@@ -7,6 +7,9 @@ Implements the paper's parent-selection formula exactly:
   w_i = s_i * h_i
   p_i = w_i / sum(w_j)
   sample without replacement when n_parents > 1
+
+Optionally, single-parent draws can use k-ary tournament selection instead:
+pick k eligible agents uniformly and keep the one with the largest w_i.
 """
 
 import math
@@ -40,6 +43,10 @@ class ParentSelector:
         focus_selection_probability: probability of selecting from
             focus_agent_ids for single-parent draws when any focused agent is
             eligible.
+        tournament_size: when greater than 1, single-parent draws that fall
+            through to the stochastic step use a tournament of this many
+            uniformly sampled eligible agents, won by the largest w_i,
+            instead of sampling from the normalised p_i (default 0, off).
     """
 
     def __init__(
@@ -54,6 +61,7 @@ class ParentSelector:
         focus_agent_ids: Optional[List[str]] = None,
         focus_selection_probability: float = 0.0,
         focus_include_descendants: bool = False,
+        tournament_size: int = 0,
     ):
         self.lam = lam
         self.alpha_0 = alpha_0
@@ -73,6 +81,7 @@ class ParentSelector:
             0.0,
             min(1.0, focus_selection_probability),
         )
+        self.tournament_size = max(0, int(tournament_size))
 
     # ------------------------------------------------------------------
     # Public API
@@ -95,19 +104,11 @@ class ParentSelector:
             List of selected ArchivedAgent objects (may be shorter than n_parents
             if the archive has fewer valid agents).
         """
-        eligible = [
-            a
-            for a in archive.agents.values()
-            if a.is_valid and self._passes_regression_filter(a, archive)
-        ]
+        eligible = self._eligible_agents(archive)
         if not eligible:
             return []
 
-        # Build child-count map: count VALID children per agent
-        child_counts: dict = {a.agent_id: 0 for a in eligible}
-        for a in archive.agents.values():
-            if a.is_valid and a.parent_id and a.parent_id in child_counts:
-                child_counts[a.parent_id] += 1
+        child_counts = self._child_counts(eligible, archive)
 
         k = min(n_parents, len(eligible))
         if (
@@ -136,21 +137,11 @@ class ParentSelector:
             if random.random() < self.elite_selection_probability:
                 return [max(eligible, key=lambda a: (a.average_score, -a.generation))]
 
-        # Compute weights
-        weights = []
-        for a in eligible:
-            s_i = 1.0 / (1.0 + math.exp(-self.lam * (a.average_score - self.alpha_0)))
-            h_i = 1.0 / (1.0 + child_counts[a.agent_id])
-            weights.append(s_i * h_i)
-
-        total_w = sum(weights)
-        if total_w == 0.0:
-            # Degenerate: all weights zero → uniform
-            weights = [1.0 / len(eligible)] * len(eligible)
-            total_w = 1.0
+        if k == 1 and self.tournament_size > 1:
+            return [self._tournament_winner(eligible, child_counts)]
 
         # Normalised probabilities
-        probs = [w / total_w for w in weights]
+        probs = self._selection_probabilities(eligible, child_counts)
 
         # Sample without replacement
         if k == 1:
@@ -187,6 +178,128 @@ class ParentSelector:
 
         return selected
 
+    def sample_parents(
+        self,
+        archive: AgentArchive,
+        n_draws: int,
+    ) -> List[ArchivedAgent]:
+        """
+        Draw ``n_draws`` independent single-parent selections in one call.
+
+        Equivalent in distribution to calling ``select_parents(archive, 1)``
+        ``n_draws`` times on an unchanged archive (sampling WITH replacement),
+        but eligibility, child counts and weights are computed once and the
+        weighted draws happen in a single ``random.choices`` call.
+
+        Returns:
+            List of ``n_draws`` selected agents, or [] if none are eligible.
+        """
+        eligible = self._eligible_agents(archive)
+        if not eligible or n_draws <= 0:
+            return []
+
+        child_counts = self._child_counts(eligible, archive)
+        # Tournament draws rank raw weights and never need p_i.
+        probs = None
+        if self.tournament_size <= 1:
+            probs = self._selection_probabilities(eligible, child_counts)
+
+        focused_pick = None
+        if self.focus_agent_ids and self.focus_selection_probability > 0:
+            focused = [a for a in eligible if self._is_focused_agent(a, archive)]
+            if focused:
+                focused_pick = max(
+                    focused,
+                    key=lambda a: (
+                        a.average_score,
+                        -child_counts.get(a.agent_id, 0),
+                        -a.generation,
+                    ),
+                )
+        elite_pick = None
+        if self.elite_selection_probability > 0:
+            elite_pick = max(eligible, key=lambda a: (a.average_score, -a.generation))
+
+        if focused_pick is None and elite_pick is None:
+            if probs is None:
+                return [
+                    self._tournament_winner(eligible, child_counts)
+                    for _ in range(n_draws)
+                ]
+            return random.choices(eligible, weights=probs, k=n_draws)
+
+        selected = []
+        for _ in range(n_draws):
+            if (
+                focused_pick is not None
+                and random.random() < self.focus_selection_probability
+            ):
+                selected.append(focused_pick)
+            elif (
+                elite_pick is not None
+                and random.random() < self.elite_selection_probability
+            ):
+                selected.append(elite_pick)
+            elif probs is None:
+                selected.append(self._tournament_winner(eligible, child_counts))
+            else:
+                selected.append(random.choices(eligible, weights=probs)[0])
+        return selected
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _eligible_agents(self, archive: AgentArchive) -> List[ArchivedAgent]:
+        """Return valid agents that pass the regression gate, in archive order."""
+        return [
+            a
+            for a in archive.agents.values()
+            if a.is_valid and self._passes_regression_filter(a, archive)
+        ]
+
+    @staticmethod
+    def _child_counts(
+        eligible: List[ArchivedAgent],
+        archive: AgentArchive,
+    ) -> dict:
+        """Count VALID children per eligible agent."""
+        child_counts: dict = {a.agent_id: 0 for a in eligible}
+        for a in archive.agents.values():
+            if a.is_valid and a.parent_id and a.parent_id in child_counts:
+                child_counts[a.parent_id] += 1
+        return child_counts
+
+    def _selection_probabilities(
+        self,
+        eligible: List[ArchivedAgent],
+        child_counts: dict,
+    ) -> List[float]:
+        """Return the paper's normalised selection probabilities p_i."""
+        weights = [self._selection_weight(a, child_counts) for a in eligible]
+
+        total_w = sum(weights)
+        if total_w == 0.0:
+            # Degenerate: all weights zero → uniform
+            return [1.0 / len(eligible)] * len(eligible)
+
+        return [w / total_w for w in weights]
+
+    def _selection_weight(self, agent: ArchivedAgent, child_counts: dict) -> float:
+        """Return the paper's unnormalised weight w_i = s_i * h_i."""
+        s_i = 1.0 / (1.0 + math.exp(-self.lam * (agent.average_score - self.alpha_0)))
+        h_i = 1.0 / (1.0 + child_counts[agent.agent_id])
+        return s_i * h_i
+
+    def _tournament_winner(
+        self,
+        eligible: List[ArchivedAgent],
+        child_counts: dict,
+    ) -> ArchivedAgent:
+        """Return the highest-weight agent among tournament_size uniform picks."""
+        contenders = random.sample(eligible, min(self.tournament_size, len(eligible)))
+        return max(contenders, key=lambda a: self._selection_weight(a, child_counts))
+
     def _is_focused_agent(
         self,
         agent: ArchivedAgent,
@@ -1,6 +1,10 @@
 """
-Root conftest.py — sets dummy env vars so no test ever needs a real API key.
+Root conftest.py — sets dummy env vars so no test ever needs a real API key,
+quiets agent INFO logging, and selects uvloop as the event loop when it is
+installed.
 """
+import asyncio
+import logging
 import os
 import sys
 from pathlib import Path
@@ -14,3 +18,17 @@ if str(PROJECT_ROOT) not in sys.path:
 os.environ.setdefault("ANTHROPIC_API_KEY", "test-key-dummy")
 os.environ.setdefault("GEMINI_API_KEY", "test-gemini-key-dummy")
 os.environ.setdefault("OPENAI_API_KEY", "test-openai-key-dummy")
+
+# Skip formatting the agent package's INFO chatter. PYTHONASYNCIODEBUG is
+# left alone: it slows every await, but a developer who sets it wants it.
+logging.getLogger("agent").setLevel(logging.WARNING)
+
+# uvloop is an optional test dependency: when installed, async tests (which
+# are dominated by task scheduling and subprocess pipe I/O) run on its loop.
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
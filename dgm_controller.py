@@ -98,6 +98,7 @@ class DGMController:
                 'focus_include_descendants',
                 False,
             ),
+            tournament_size=ps_cfg.get('tournament_size', 0),
         )
 
         evaluation_config = self.config.get('evaluation', {})
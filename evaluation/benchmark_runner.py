@@ -10,6 +10,7 @@ import json
 import os
 import re
 import shlex
+import signal
 import sys
 import tempfile
 import time
@@ -40,6 +41,8 @@ _TEST_PROCESS_MEMORY_LIMIT_MB = 192
 _STDIN_OUTPUT_CAPTURE_LIMIT_BYTES = 16 * 1024 * 1024
 _STDIN_STDERR_CAPTURE_LIMIT_BYTES = 256 * 1024
 _SUBSET_DP_RESOURCE_GUARD_MIN_N = 12
+# libyaml's C loader when PyYAML was built with it; same safe schema either way.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def _apply_test_process_resource_limits() -> None:
@@ -139,7 +142,7 @@ class BenchmarkTask:
     def from_config(cls, config_path: str) -> 'BenchmarkTask':
         """Load benchmark task from configuration file."""
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YAML_SAFE_LOADER)
 
         return cls(
             name=config['name'],
@@ -769,7 +772,11 @@ with Path(_input_file).open("rb") as _stdin_handle, _stdout_path.open("wb") as _
             _run_error = f"Timeout after {{_timeout}}s"
             _proc.kill()
             break
-        time.sleep(0.05)
+        # Sleep between limit checks, but wake as soon as the solution exits.
+        try:
+            _proc.wait(timeout=0.05)
+        except subprocess.TimeoutExpired:
+            pass
     _proc.wait()
 
 if _run_error is not None:
@@ -960,6 +967,7 @@ _emit({{
                         stdout=asyncio.subprocess.PIPE,
                         stderr=asyncio.subprocess.PIPE,
                         preexec_fn=_apply_test_process_resource_limits,
+                        start_new_session=True,  # own process group for killpg
                     )
 
                     try:
@@ -968,9 +976,10 @@ _emit({{
                             timeout=subprocess_timeout
                         )
                     except asyncio.TimeoutError:
-                        # Kill the subprocess cleanly on timeout.
+                        # Kill the whole process group on timeout so a stdin
+                        # harness's solution child does not outlive it.
                         try:
-                            proc.kill()
+                            os.killpg(proc.pid, signal.SIGKILL)
                         except ProcessLookupError:
                             pass
                         await proc.wait()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
+import os
 import sys
 import warnings
 from pathlib import Path
@@ -28,15 +29,27 @@ async def score_solution(
     benchmark: BenchmarkTask,
     solution_path: Path,
     label: str,
+    max_concurrency: int | None = None,
 ) -> dict[str, Any]:
-    """Run one solution file through every test case in a benchmark."""
+    """Run one solution file through every test case in a benchmark.
+
+    At most *max_concurrency* test cases (default: the CPU count) run at
+    once, since each one spawns its own subprocesses.
+    """
     solution = solution_path.read_text()
-    test_results = []
+    semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+
+    async def run_case(test_case: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await runner._run_test_case(solution, test_case, benchmark)
 
-    for test_case in benchmark.test_cases:
-        result = await runner._run_test_case(solution, test_case, benchmark)
+    # Test cases run in separate temp dirs, so they can overlap up to the
+    # bound; gather preserves benchmark order in the report.
+    test_results = await asyncio.gather(
+        *(run_case(test_case) for test_case in benchmark.test_cases)
+    )
+    for test_case, result in zip(benchmark.test_cases, test_results):
         result["function_name"] = test_case.get("function_name", "solve")
-        test_results.append(result)
 
     score = runner._calculate_score({"test_results": test_results}, benchmark)
     passed = sum(result.get("passed", 0) for result in test_results)
@@ -68,6 +81,8 @@ async def compare_solutions(
         raise ValueError(f"Unknown benchmark {benchmark_name!r}. Known benchmarks: {known}")
 
     benchmark = runner.benchmarks[benchmark_name]
+    # Score one solution at a time so the two never compete for the same
+    # concurrency budget.
     baseline = await score_solution(runner, benchmark, baseline_path, baseline_label)
     candidate = await score_solution(runner, benchmark, candidate_path, candidate_label)
 
@@ -247,21 +247,24 @@ class ImplementationManager:
             return False
 
         content = file_path.read_text()
-        occurrences = content.count(change.old_code)
-
-        if occurrences == 0:
+        old_code = change.old_code
+        # Locate the match and look past it for a second one, so the file is
+        # scanned once on the common (unique) path; count only to report.
+        start = content.find(old_code)
+        if start == -1:
             raise RuntimeError(
                 f"old_code not found in {file_path}: no occurrences of the search text"
             )
-        if occurrences > 1:
+        end = start + len(old_code)
+        if content.find(old_code, end) != -1:
+            occurrences = content.count(old_code)
             raise RuntimeError(
                 f"Ambiguous match in {file_path}: {occurrences} occurrences found; "
                 "provide more context to make the match unique"
             )
 
         # Exactly one occurrence — safe to replace.
-        new_content = content.replace(change.old_code, change.new_code, 1)
-        file_path.write_text(new_content)
+        file_path.write_text(content[:start] + change.new_code + content[end:])
         return True
     
     def _apply_delete_change(self, file_path: Path, change: 'CodeChange') -> bool:
@@ -317,12 +320,14 @@ class ImplementationManager:
             'warnings': []
         }
         
-        # Check Python syntax
+        # Check Python syntax; the trees are handed to the import check so
+        # each file is parsed once per verification.
+        trees: Dict[Path, ast.Module] = {}
         agent_files = Path(agent_path).rglob("*.py")
         for file_path in agent_files:
             try:
                 content = file_path.read_text()
-                ast.parse(content)
+                trees[file_path] = ast.parse(content, filename=str(file_path))
             except SyntaxError as e:
                 results['valid'] = False
                 results['errors'].append(f"Syntax error in {file_path}: {str(e)}")
@@ -332,7 +337,7 @@ class ImplementationManager:
         # Check imports
         try:
             # Simple import check - could be enhanced
-            import_errors = self._check_imports(agent_path)
+            import_errors = self._check_imports(agent_path, trees)
             if import_errors:
                 results['errors'].extend(import_errors)
                 results['valid'] = False
@@ -341,7 +346,11 @@ class ImplementationManager:
         
         return results
     
-    def _check_imports(self, agent_path: str) -> List[str]:
+    def _check_imports(
+        self,
+        agent_path: str,
+        trees: Optional[Dict[Path, ast.Module]] = None,
+    ) -> List[str]:
         """
         Check that every top-level import in modified Python files can be resolved.
 
@@ -356,6 +365,8 @@ class ImplementationManager:
 
         Args:
             agent_path: Path to agent code
+            trees: Optional already-parsed trees keyed by file path; files
+                missing from it are read and parsed here
 
         Returns:
             List of import-error strings (empty when everything resolves)
@@ -363,9 +374,11 @@ class ImplementationManager:
         errors: List[str] = []
 
         for py_file in Path(agent_path).rglob("*.py"):
+            tree = trees.get(py_file) if trees else None
             try:
-                source = py_file.read_text()
-                tree = ast.parse(source, filename=str(py_file))
+                if tree is None:
+                    source = py_file.read_text()
+                    tree = ast.parse(source, filename=str(py_file))
             except SyntaxError:
                 # Syntax errors are caught separately in _verify_modifications.
                 continue
@@ -12,7 +12,7 @@ import uuid
 import asyncio
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeChange:
     """Represents a specific code change to be made."""
     file_path: str
@@ -28,7 +28,7 @@ class CodeChange:
         return f"{self.change_type.upper()}: {self.description} (Priority: {self.priority})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModificationProposal:
     """Proposal for modifying agent code to improve performance."""
     proposal_id: str
@@ -157,15 +157,8 @@ class ModificationProposer:
         if diagnosis.code_structure_issues:
             priorities.append('code_structure')
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_priorities = []
-        for item in priorities:
-            if item not in seen:
-                seen.add(item)
-                unique_priorities.append(item)
-        
-        return unique_priorities[:4]  # Limit to top 4 priorities
+        # Remove duplicates while preserving order; limit to top 4 priorities
+        return list(dict.fromkeys(priorities))[:4]
     
     async def _generate_code_changes(
         self,
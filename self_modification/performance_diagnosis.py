@@ -5,6 +5,7 @@ This module provides functionality to diagnose performance issues in the agent's
 execution, analyze code structure, and generate improvement suggestions.
 """
 
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -61,18 +62,28 @@ class PerformanceDiagnosis:
             detailed_results=benchmark_results.get('detailed_results', {})
         )
         
-        # Analyze different aspects
-        await self._analyze_code_structure(agent_path, report)
-        self._analyze_tool_usage(agent_path, report)
+        # Analyze different aspects; both code checks share one read of agent.py
+        agent_source = self._read_agent_source(agent_path)
+        await self._analyze_code_structure(agent_path, report, agent_source)
+        self._analyze_tool_usage(agent_path, report, agent_source)
         self._analyze_benchmark_failures(benchmark_results, report)
         self._generate_improvement_suggestions(report)
         
         return report
     
+    @staticmethod
+    def _read_agent_source(agent_path: str) -> Optional[str]:
+        """Return the text of the main agent file, or None if it is missing."""
+        agent_file = Path(agent_path) / "agent" / "agent.py"
+        if not agent_file.exists():
+            return None
+        return agent_file.read_text()
+    
     async def _analyze_code_structure(
         self, 
         agent_path: str, 
-        report: DiagnosisReport
+        report: DiagnosisReport,
+        agent_source: Optional[str] = None
     ) -> None:
         """
         Analyze code structure for potential issues.
@@ -80,13 +91,13 @@ class PerformanceDiagnosis:
         Args:
             agent_path: Path to agent code
             report: Report to update with findings
+            agent_source: Already-read agent.py text; read from disk if None
         """
-        path = Path(agent_path)
-        
         # Analyze main agent file
-        agent_file = path / "agent" / "agent.py"
-        if agent_file.exists():
-            content = agent_file.read_text()
+        if agent_source is None:
+            agent_source = self._read_agent_source(agent_path)
+        if agent_source is not None:
+            content = agent_source
             
             # Check for empty methods
             if "pass" in content and content.count("def ") > content.count("pass") - 1:
@@ -121,29 +132,35 @@ class PerformanceDiagnosis:
                     "Failed to parse agent code - possible syntax issues"
                 )
     
-    def _analyze_tool_usage(self, agent_path: str, report: DiagnosisReport) -> None:
+    def _analyze_tool_usage(
+        self,
+        agent_path: str,
+        report: DiagnosisReport,
+        agent_source: Optional[str] = None
+    ) -> None:
         """
         Analyze tool usage patterns.
         
         Args:
             agent_path: Path to agent code
             report: Report to update with findings
+            agent_source: Already-read agent.py text; read from disk if None
         """
         path = Path(agent_path)
         
         # Check for tool implementations
         tools_dir = path / "agent" / "tools"
-        if not tools_dir.exists() or not list(tools_dir.glob("*.py")):
+        if not tools_dir.exists() or next(tools_dir.glob("*.py"), None) is None:
             report.tool_usage_issues.append(
                 "No tool implementations found"
             )
             return
         
         # Check tool registrations
-        agent_file = path / "agent" / "agent.py"
-        if agent_file.exists():
-            content = agent_file.read_text()
-            if "register_tool" not in content and "ToolRegistry" not in content:
+        if agent_source is None:
+            agent_source = self._read_agent_source(agent_path)
+        if agent_source is not None:
+            if "register_tool" not in agent_source and "ToolRegistry" not in agent_source:
                 report.tool_usage_issues.append(
                     "No tool registration found in agent"
                 )
@@ -164,15 +181,16 @@ class PerformanceDiagnosis:
         
         for benchmark_name, results in detailed_results.items():
             if 'test_results' in results:
-                timeout_count = 0
-                error_types = {}
-                
-                for test in results['test_results']:
-                    if not test.get('passed', True):
-                        error = test.get('error', 'Unknown error')
-                        if 'Timeout' in error:
-                            timeout_count += 1
-                        error_types[error] = error_types.get(error, 0) + 1
+                # Tally failures per distinct error first, so the timeout
+                # keyword is checked once per error message, not per test.
+                error_types = Counter(
+                    test.get('error', 'Unknown error')
+                    for test in results['test_results']
+                    if not test.get('passed', True)
+                )
+                timeout_count = sum(
+                    count for error, count in error_types.items() if 'Timeout' in error
+                )
                 
                 if timeout_count > len(results['test_results']) * 0.3:
                     report.timeout_patterns.append(
@@ -0,0 +1,20 @@
+"""
+Conftest for the tests/ tree.
+
+Unit and integration tests write many small files (agent.py copies, EditTool
+targets, benchmark YAMLs, archive metadata) and often spawn subprocesses that
+read them back.  Module- and session-scoped fixtures place those workspaces on
+the /dev/shm tmpfs (via ``tmpfs_root``) so fixture I/O stays in memory while
+keeping real filesystem semantics for the subprocesses.  The builtin
+``tmp_path`` is left as is; run with ``--basetemp`` or ``TMPDIR`` on a tmpfs to
+move it as well.
+"""
+import pytest
+
+from tests.test_utils import TMPFS_ROOT
+
+
+@pytest.fixture(scope="session")
+def tmpfs_root():
+    """Directory for test workspaces: /dev/shm when usable, else the system default."""
+    return TMPFS_ROOT
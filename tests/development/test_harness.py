@@ -10,26 +10,126 @@ import argparse
 from pathlib import Path
 import time
 import json
+from collections import deque
 from datetime import datetime
 
+# Result-dict keys are looked up on every summary/print pass; intern them once.
+_K_UNIT = sys.intern("unit_tests")
+_K_INTEG = sys.intern("integration_tests")
+_K_SUMMARY = sys.intern("summary")
+
+
+TESTMAP_PATH = Path(".pytest_cache/dgm_testmap.json")
+
+
+def _load_testmap():
+    """Load the cached discovery manifest, or an empty one if unusable."""
+    try:
+        with open(TESTMAP_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_testmap(testmap):
+    """Persist the discovery manifest; caching failures are non-fatal."""
+    try:
+        TESTMAP_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(TESTMAP_PATH, 'w') as f:
+            json.dump(testmap, f)
+    except OSError:
+        pass
+
+
+def _iter_tests(suite):
+    """Yield individual test cases from a (possibly nested) suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+_SUMMED_KEYS = ("total", "success", "failures", "errors", "duration")
+
+
+class RingBufferedStream:
+    """Text stream that keeps only the last ``max_chars`` characters written.
+    
+    Used as the TextTestRunner stream with --quiet-on-pass so passing runs hold
+    bounded memory; the retained tail is dumped when a suite fails.
+    """
+    
+    def __init__(self, target, max_chars=64 * 1024):
+        self.target = target
+        self.max_chars = max_chars
+        self._chunks = deque()
+        self._size = 0
+    
+    def write(self, text):
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size > self.max_chars and len(self._chunks) > 1:
+            self._size -= len(self._chunks.popleft())
+        return len(text)
+    
+    def flush(self):
+        pass
+    
+    def dump(self):
+        """Write the retained output to the target stream and clear the buffer."""
+        text = "".join(self._chunks)[-self.max_chars:]
+        self._chunks.clear()
+        self._size = 0
+        self.target.write(text)
+        self.target.flush()
+
 
 class TestHarness:
     """Main test harness for DGM system."""
     
-    def __init__(self, verbosity=2):
+    def __init__(self, verbosity=2, quiet_on_pass=False, ring_buffer_kb=64):
         """Initialize test harness."""
         self.verbosity = verbosity
+        self.quiet_on_pass = quiet_on_pass
+        self.ring_buffer_kb = ring_buffer_kb
         self.test_results = {
             "timestamp": datetime.now().isoformat(),
-            "unit_tests": {},
-            "integration_tests": {},
-            "summary": {}
+            _K_UNIT: {},
+            _K_INTEG: {},
+            _K_SUMMARY: {}
         }
     
     def discover_tests(self, test_dir, pattern="test_*.py"):
-        """Discover all tests in directory."""
+        """Discover all tests in directory.
+        
+        Discovery output is cached in TESTMAP_PATH keyed by per-file mtimes, so
+        a warm run loads the recorded test names instead of walking packages.
+        """
         loader = unittest.TestLoader()
+        test_dir = Path(test_dir)
+        cache_key = f"{test_dir}:{pattern}"
+        mtimes = {
+            str(path): path.stat().st_mtime_ns
+            for path in sorted(test_dir.rglob(pattern))
+        }
+        
+        testmap = _load_testmap()
+        cached = testmap.get(cache_key)
+        if cached and cached.get("mtimes") == mtimes:
+            # Mirror the sys.path entry discover() would have added
+            top_level_dir = str(test_dir.resolve())
+            if top_level_dir not in sys.path:
+                sys.path.insert(0, top_level_dir)
+            return loader.loadTestsFromNames(cached["names"])
+        
         suite = loader.discover(str(test_dir), pattern=pattern)
+        if not loader.errors:
+            testmap[cache_key] = {
+                "mtimes": mtimes,
+                "names": [test.id() for test in _iter_tests(suite)],
+            }
+            _save_testmap(testmap)
         return suite
     
     def run_test_suite(self, suite, suite_name):
@@ -38,10 +138,9 @@ class TestHarness:
         print(f"Running {suite_name}")
         print(f"{'='*60}")
         
-        runner = unittest.TextTestRunner(verbosity=self.verbosity)
-        start_time = time.time()
-        result = runner.run(suite)
-        duration = time.time() - start_time
+        start_ns = time.perf_counter_ns()
+        result = self._run_suite(suite)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Collect results
         test_count = result.testsRun
@@ -75,6 +174,17 @@ class TestHarness:
         
         return suite_results, result.wasSuccessful()
     
+    def _run_suite(self, suite):
+        """Run a suite, buffering runner output in a ring buffer if quiet_on_pass."""
+        if not self.quiet_on_pass:
+            return unittest.TextTestRunner(verbosity=self.verbosity).run(suite)
+        
+        stream = RingBufferedStream(sys.stderr, max_chars=self.ring_buffer_kb * 1024)
+        result = unittest.TextTestRunner(stream=stream, verbosity=self.verbosity).run(suite)
+        if not result.wasSuccessful():
+            stream.dump()
+        return result
+    
     def run_unit_tests(self):
         """Run all unit tests."""
         unit_test_dir = Path("tests/unit")
@@ -84,7 +194,7 @@ class TestHarness:
         
         suite = self.discover_tests(unit_test_dir)
         results, success = self.run_test_suite(suite, "Unit Tests")
-        self.test_results["unit_tests"] = results
+        self.test_results[_K_UNIT] = results
         return success
     
     def run_integration_tests(self):
@@ -96,7 +206,7 @@ class TestHarness:
         
         suite = self.discover_tests(integration_test_dir)
         results, success = self.run_test_suite(suite, "Integration Tests")
-        self.test_results["integration_tests"] = results
+        self.test_results[_K_INTEG] = results
         return success
     
     def run_specific_test(self, test_path):
@@ -116,34 +226,34 @@ class TestHarness:
             # Test case or method
             suite = loader.loadTestsFromName(test_path)
         
-        runner = unittest.TextTestRunner(verbosity=self.verbosity)
-        result = runner.run(suite)
+        result = self._run_suite(suite)
         return result.wasSuccessful()
     
     def generate_summary(self):
         """Generate test summary."""
-        unit_results = self.test_results.get("unit_tests", {})
-        integration_results = self.test_results.get("integration_tests", {})
+        unit_results = self.test_results.get(_K_UNIT, {})
+        integration_results = self.test_results.get(_K_INTEG, {})
         
-        total_tests = unit_results.get("total", 0) + integration_results.get("total", 0)
-        total_success = unit_results.get("success", 0) + integration_results.get("success", 0)
-        total_failures = unit_results.get("failures", 0) + integration_results.get("failures", 0)
-        total_errors = unit_results.get("errors", 0) + integration_results.get("errors", 0)
-        total_duration = unit_results.get("duration", 0) + integration_results.get("duration", 0)
+        totals = dict.fromkeys(_SUMMED_KEYS, 0)
+        for sub in (unit_results, integration_results):
+            for key in _SUMMED_KEYS:
+                totals[key] += sub.get(key, 0)
         
-        self.test_results["summary"] = {
+        total_tests = totals["total"]
+        has_tests = total_tests > 0
+        self.test_results[_K_SUMMARY] = {
             "total_tests": total_tests,
-            "total_success": total_success,
-            "total_failures": total_failures,
-            "total_errors": total_errors,
-            "total_duration": round(total_duration, 2),
-            "overall_success_rate": round((total_success / total_tests * 100) if total_tests > 0 else 0, 2),
-            "all_passed": total_failures == 0 and total_errors == 0
+            "total_success": totals["success"],
+            "total_failures": totals["failures"],
+            "total_errors": totals["errors"],
+            "total_duration": round(totals["duration"], 2),
+            "overall_success_rate": round((totals["success"] / total_tests * 100) if has_tests else 0, 2),
+            "all_passed": totals["failures"] == 0 and totals["errors"] == 0
         }
     
     def print_summary(self):
         """Print test summary."""
-        summary = self.test_results["summary"]
+        summary = self.test_results[_K_SUMMARY]
         
         print(f"\n{'='*60}")
         print("TEST SUMMARY")
@@ -213,6 +323,17 @@ def main():
         type=str,
         help="Run specific test (e.g., 'tests.unit.test_archive' or 'tests.unit.test_archive.TestArchive.test_add_agent')"
     )
+    parser.add_argument(
+        "--quiet-on-pass",
+        action="store_true",
+        help="Keep only the tail of runner output in memory and print it if a suite fails"
+    )
+    parser.add_argument(
+        "--ring-buffer-kb",
+        type=int,
+        default=64,
+        help="Runner output retained with --quiet-on-pass, in KB (default: 64)"
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -223,7 +344,11 @@ def main():
     args = parser.parse_args()
     
     # Initialize harness
-    harness = TestHarness(verbosity=args.verbosity)
+    harness = TestHarness(
+        verbosity=args.verbosity,
+        quiet_on_pass=args.quiet_on_pass,
+        ring_buffer_kb=args.ring_buffer_kb,
+    )
     
     # Run tests based on arguments
     if args.test:
@@ -232,13 +357,13 @@ def main():
     elif args.unit_only:
         # Run only unit tests
         success = harness.run_unit_tests()
-        harness.test_results["summary"] = harness.test_results["unit_tests"]
+        harness.test_results[_K_SUMMARY] = harness.test_results[_K_UNIT]
         harness.print_summary()
         harness.save_results(args.output)
     elif args.integration_only:
         # Run only integration tests
         success = harness.run_integration_tests()
-        harness.test_results["summary"] = harness.test_results["integration_tests"]
+        harness.test_results[_K_SUMMARY] = harness.test_results[_K_INTEG]
         harness.print_summary()
         harness.save_results(args.output)
     else:
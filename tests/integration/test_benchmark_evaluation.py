@@ -6,14 +6,40 @@ No network, no Agent FM calls.
 """
 
 import asyncio
+import json
+import tempfile
 import pytest
-import yaml
 from pathlib import Path
 
 from evaluation.benchmark_runner import BenchmarkRunner, BenchmarkTask
 from evaluation.scorer import BenchmarkScorer
 
 
+# Benchmark fixtures are written as JSON: it is valid YAML for the runner's
+# loader and the C json encoder is far cheaper than PyYAML's emitter.
+_HIDDEN_ADD_BENCHMARK_JSON = json.dumps({
+    "name": "hidden_add",
+    "description": "Add two numbers",
+    "task_prompt": "Implement add(a, b).",
+    "prompt_test_cases": [
+        {
+            "function_name": "add",
+            "inputs": ["1, 2"],
+            "expected_outputs": ["3"],
+        }
+    ],
+    "test_cases": [
+        {
+            "function_name": "add",
+            "inputs": ["10, 20"],
+            "expected_outputs": ["30"],
+        }
+    ],
+    "timeout": 10,
+    "scoring_method": "partial",
+})
+
+
 def _write_benchmark(bdir: Path, name: str, test_cases: list,
                      scoring_method: str = "partial", timeout: int = 10) -> Path:
     cfg = {
@@ -25,27 +51,32 @@ def _write_benchmark(bdir: Path, name: str, test_cases: list,
         "scoring_method": scoring_method,
     }
     p = bdir / f"{name}.yaml"
-    p.write_text(yaml.dump(cfg))
+    p.write_text(json.dumps(cfg))
     return p
 
 
-class TestBenchmarkEvaluationPipeline:
-
-    @pytest.fixture(autouse=True)
-    def setup(self, tmp_path):
-        self.bdir = tmp_path / "benchmarks"
-        self.bdir.mkdir()
-        _write_benchmark(self.bdir, "add", [
+@pytest.fixture(scope="class")
+def add_benchmark_runner(request, tmpfs_root):
+    """Write the read-only ``add`` benchmark and its runner once per test class."""
+    cls = request.cls
+    with tempfile.TemporaryDirectory(dir=tmpfs_root, prefix="dgm_") as tmpdir:
+        cls.bdir = Path(tmpdir)
+        _write_benchmark(cls.bdir, "add", [
             {
                 "function_name": "add",
                 "inputs": ["1, 2", "5, 5", "100, 200"],
                 "expected_outputs": ["3", "10", "300"],
             }
         ])
-        self.runner = BenchmarkRunner(
-            benchmarks_dir=str(self.bdir),
+        cls.runner = BenchmarkRunner(
+            benchmarks_dir=str(cls.bdir),
             use_sandbox=False,
         )
+        yield
+
+
+@pytest.mark.usefixtures("add_benchmark_runner")
+class TestBenchmarkEvaluationPipeline:
 
     async def test_runner_loads_benchmark(self):
         assert "add" in self.runner.benchmarks
@@ -118,28 +149,7 @@ class TestBenchmarkEvaluationPipeline:
     async def test_prompt_test_cases_are_public_examples_only(self, tmp_path):
         bdir = tmp_path / "hidden_benchmarks"
         bdir.mkdir()
-        cfg = {
-            "name": "hidden_add",
-            "description": "Add two numbers",
-            "task_prompt": "Implement add(a, b).",
-            "prompt_test_cases": [
-                {
-                    "function_name": "add",
-                    "inputs": ["1, 2"],
-                    "expected_outputs": ["3"],
-                }
-            ],
-            "test_cases": [
-                {
-                    "function_name": "add",
-                    "inputs": ["10, 20"],
-                    "expected_outputs": ["30"],
-                }
-            ],
-            "timeout": 10,
-            "scoring_method": "partial",
-        }
-        (bdir / "hidden_add.yaml").write_text(yaml.safe_dump(cfg))
+        (bdir / "hidden_add.yaml").write_text(_HIDDEN_ADD_BENCHMARK_JSON)
         runner = BenchmarkRunner(benchmarks_dir=str(bdir), use_sandbox=False)
         captured = {}
 
@@ -170,10 +180,12 @@ async def test_humaneval_style_reference_solution_passes():
         project_root / "tests" / "fixtures" / "reference_solutions" / "humaneval_style.py"
     ).read_text()
 
-    test_results = []
-    for test_case in task.test_cases:
-        result = await runner._run_test_case(reference_solution, test_case, task)
-        test_results.append(result)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(runner._run_test_case(reference_solution, test_case, task))
+            for test_case in task.test_cases
+        ]
+    test_results = [t.result() for t in tasks]
 
     assert len(task.test_cases) == 4
     assert all(result["success"] for result in test_results)
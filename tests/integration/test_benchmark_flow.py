@@ -1,24 +1,21 @@
 """Test to trace the benchmark execution flow and find where the error occurs."""
 
 import asyncio
+import os
 import traceback
 from pathlib import Path
-import sys
 import logging
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-from evaluation.benchmark_runner import BenchmarkRunner
-from agent.agent import Agent, AgentConfig
-from dgm_controller import DGMController
-
-# Setup logging to trace execution
-logging.basicConfig(level=logging.DEBUG, format='%(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 async def trace_benchmark_error():
     """Trace where the BenchmarkTask.get() error occurs."""
+    # Imported here so pytest collection of this script does not load the
+    # controller, provider SDKs and benchmark runner.
+    from evaluation.benchmark_runner import BenchmarkRunner
+    from agent.agent import Agent, AgentConfig
+    from dgm_controller import DGMController
+    
     try:
         # Load config
         controller = DGMController()
@@ -33,7 +30,7 @@ async def trace_benchmark_error():
         
         # Create agent
         agent = Agent(agent_config)
-        logger.info(f"Created agent: {agent.agent_id}")
+        logger.info("Created agent: %s", agent.agent_id)
         
         # Create benchmark runner
         benchmark_runner = BenchmarkRunner(
@@ -49,12 +46,23 @@ async def trace_benchmark_error():
             verbose=True
         )
         
-        logger.info(f"Benchmark result: {result}")
+        logger.info("Benchmark result: %s", result)
         
     except Exception as e:
-        logger.error(f"Error occurred: {type(e).__name__}: {e}")
+        logger.error("Error occurred: %s: %s", type(e).__name__, e)
         logger.error("Full traceback:")
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(trace_benchmark_error())
\ No newline at end of file
+    # Configure logging only when run as a script, so pytest collection does
+    # not switch the root logger to DEBUG. Set TRACE_LEVEL=DEBUG for a full trace.
+    logging.basicConfig(
+        level=os.environ.get("TRACE_LEVEL", "INFO").upper(),
+        format='%(name)s - %(levelname)s - %(message)s',
+    )
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(trace_benchmark_error())
+    else:
+        uvloop.run(trace_benchmark_error())
\ No newline at end of file
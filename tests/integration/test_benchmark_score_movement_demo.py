@@ -1,8 +1,10 @@
+import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-from scripts.compare_benchmark_solutions import compare_solutions
+from scripts.compare_benchmark_solutions import compare_solutions, score_solution
 
 
 @pytest.mark.asyncio
@@ -66,3 +68,31 @@ async def test_calibrated_demo_solutions_show_broad_hidden_case_score_movement()
     assert report["baseline"]["total"] == 50
     assert report["candidate"]["passed"] == 50
     assert report["candidate"]["total"] == 50
+
+
+@pytest.mark.asyncio
+async def test_score_solution_bounds_concurrent_test_cases(tmp_path):
+    solution_path = tmp_path / "solution.py"
+    solution_path.write_text("def solve():\n    return 1\n")
+    in_flight = 0
+    peak = 0
+
+    class FakeRunner:
+        async def _run_test_case(self, solution, test_case, benchmark):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True, "passed": 1, "total": 1}
+
+        def _calculate_score(self, result, benchmark):
+            return 1.0
+
+    benchmark = SimpleNamespace(test_cases=[{"function_name": "solve"}] * 6)
+    report = await score_solution(
+        FakeRunner(), benchmark, solution_path, "label", max_concurrency=2
+    )
+
+    assert peak == 2
+    assert report["passed"] == report["total"] == 6
@@ -3,26 +3,39 @@ Basic integration test: DGMController can be instantiated with a minimal config
 (The heavy end-to-end loop is in test_dgm_loop.py.)
 """
 
+import json
+import tempfile
+
 import pytest
-import yaml
 from pathlib import Path
 
+# JSON is valid YAML for the benchmark loader; serialize the fixture once.
+_DUMMY_BENCHMARK_JSON = json.dumps({
+    "name": "dummy",
+    "description": "dummy",
+    "task_prompt": "dummy",
+    "test_cases": [
+        {"function_name": "f", "inputs": ["1"], "expected_outputs": ["1"]}
+    ],
+    "timeout": 5,
+    "scoring_method": "pass_fail",
+})
+
+# Must use sync def — validator only recognises ast.FunctionDef (production bug).
+_INITIAL_AGENT_BYTES = (
+    b'class Agent:\n'
+    b'    def __init__(self, config): pass\n'
+    b'    def solve_task(self, task):\n'
+    b'        async def _r(): return {"success": True, "solution": ""}\n'
+    b'        return _r()\n'
+)
+
 
 def _make_minimal_config(tmp_path: Path) -> dict:
     bench_dir = tmp_path / "benchmarks"
     bench_dir.mkdir()
     # Write a valid (but trivially simple) benchmark
-    cfg = {
-        "name": "dummy",
-        "description": "dummy",
-        "task_prompt": "dummy",
-        "test_cases": [
-            {"function_name": "f", "inputs": ["1"], "expected_outputs": ["1"]}
-        ],
-        "timeout": 5,
-        "scoring_method": "pass_fail",
-    }
-    (bench_dir / "dummy.yaml").write_text(yaml.dump(cfg))
+    (bench_dir / "dummy.yaml").write_text(_DUMMY_BENCHMARK_JSON)
 
     arc_dir = tmp_path / "archive"
     results_dir = tmp_path / "results"
@@ -31,14 +44,7 @@ def _make_minimal_config(tmp_path: Path) -> dict:
         d.mkdir()
 
     initial = tmp_path / "agent.py"
-    # Must use sync def — validator only recognises ast.FunctionDef (production bug).
-    initial.write_text(
-        'class Agent:\n'
-        '    def __init__(self, config): pass\n'
-        '    def solve_task(self, task):\n'
-        '        async def _r(): return {"success": True, "solution": ""}\n'
-        '        return _r()\n'
-    )
+    initial.write_bytes(_INITIAL_AGENT_BYTES)
 
     return {
         "fm_providers": {
@@ -67,27 +73,32 @@ def _make_minimal_config(tmp_path: Path) -> dict:
     }
 
 
+@pytest.fixture(scope="class")
+def shared_controller(request, tmpfs_root):
+    """Build one controller per class; its tests only inspect it."""
+    from dgm_controller import DGMController
+    cls = request.cls
+    with tempfile.TemporaryDirectory(dir=tmpfs_root, prefix="dgm_") as tmpdir:
+        workspace = Path(tmpdir)
+        cls.cfg = _make_minimal_config(workspace)
+        cls.controller = DGMController(config_or_path=cls.cfg, workspace=str(workspace))
+        yield
+
+
+@pytest.mark.usefixtures("shared_controller")
 class TestDGMControllerInit:
 
-    def test_controller_init_from_dict(self, tmp_path):
+    def test_controller_init_from_dict(self):
         """DGMController can be constructed from a config dict without raising."""
-        from dgm_controller import DGMController
-        cfg = _make_minimal_config(tmp_path)
-        controller = DGMController(config_or_path=cfg, workspace=str(tmp_path))
+        controller = self.controller
         assert controller is not None
         assert controller.archive is not None
         assert controller.parent_selector is not None
         assert controller.benchmark_runner is not None
         assert controller.validator is not None
 
-    def test_archive_dir_created(self, tmp_path):
-        from dgm_controller import DGMController
-        cfg = _make_minimal_config(tmp_path)
-        controller = DGMController(config_or_path=cfg, workspace=str(tmp_path))
-        assert Path(cfg["archive"]["path"]).exists()
-
-    def test_initial_archive_is_empty(self, tmp_path):
-        from dgm_controller import DGMController
-        cfg = _make_minimal_config(tmp_path)
-        controller = DGMController(config_or_path=cfg, workspace=str(tmp_path))
-        assert len(controller.archive.agents) == 0
+    def test_archive_dir_created(self):
+        assert Path(self.cfg["archive"]["path"]).exists()
+
+    def test_initial_archive_is_empty(self):
+        assert len(self.controller.archive.agents) == 0
@@ -17,19 +17,11 @@ Strategy
    - a second generation can select the first child as a parent
 """
 
-import asyncio
 import json
-import math
-import os
 import random
-import uuid
 from pathlib import Path
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import patch
 
-import pytest
-import yaml
-
-from archive.agent_archive import AgentArchive
 from archive.parent_selector import ParentSelector
 from agent.fm_interface.api_handler import CompletionResponse, ToolCall
 
@@ -81,6 +73,9 @@ class _Config:
     pass
 '''
 
+# Encoded once; every config build writes the same initial agent file.
+_AGENT_CODE_SOLVES_ADD_BYTES = AGENT_CODE_SOLVES_ADD.encode()
+
 # The "child" agent written by the self-modification step.
 CHILD_AGENT_CODE = AGENT_CODE_SOLVES_ADD.replace(
     "returns a solution to the add benchmark.",
@@ -88,24 +83,27 @@ CHILD_AGENT_CODE = AGENT_CODE_SOLVES_ADD.replace(
 )
 
 
+# Written as JSON (valid YAML for the benchmark loader) and serialized once.
+_ADD_BENCHMARK_JSON = json.dumps({
+    "name": "add_two_numbers",
+    "description": "Add two numbers",
+    "task_prompt": "Write a Python function add(a, b) that returns a+b.",
+    "test_cases": [
+        {
+            "function_name": "add",
+            "inputs": ["1, 2", "10, 20"],
+            "expected_outputs": ["3", "30"],
+        }
+    ],
+    "timeout": 10,
+    "scoring_method": "partial",
+})
+
+
 def _make_benchmark_yaml(bdir: Path) -> None:
     """Write a single-task benchmark YAML."""
-    config = {
-        "name": "add_two_numbers",
-        "description": "Add two numbers",
-        "task_prompt": "Write a Python function add(a, b) that returns a+b.",
-        "test_cases": [
-            {
-                "function_name": "add",
-                "inputs": ["1, 2", "10, 20"],
-                "expected_outputs": ["3", "30"],
-            }
-        ],
-        "timeout": 10,
-        "scoring_method": "partial",
-    }
     bdir.mkdir(parents=True, exist_ok=True)
-    (bdir / "add_two_numbers.yaml").write_text(yaml.dump(config))
+    (bdir / "add_two_numbers.yaml").write_text(_ADD_BENCHMARK_JSON)
 
 
 def _make_dgm_config(tmp_path: Path) -> dict:
@@ -119,7 +117,7 @@ def _make_dgm_config(tmp_path: Path) -> dict:
         d.mkdir(parents=True, exist_ok=True)
 
     _make_benchmark_yaml(bench_dir)
-    initial_agent.write_text(AGENT_CODE_SOLVES_ADD)
+    initial_agent.write_bytes(_AGENT_CODE_SOLVES_ADD_BYTES)
 
     return {
         "fm_providers": {
@@ -155,33 +153,29 @@ def _make_dgm_config(tmp_path: Path) -> dict:
 # Scripted FM responses used by _run_generation
 # ---------------------------------------------------------------------------
 
-def _edit_tool_response(workspace_agent_path: Path) -> CompletionResponse:
-    """
-    Return a CompletionResponse that writes the child agent code via the edit tool.
-    The path must be relative so the edit tool resolves it inside the workspace.
-    """
-    tc = ToolCall(
-        tool_name="edit",
-        parameters={
-            "action": "write",
-            "file_path": "agent.py",
-            "content": CHILD_AGENT_CODE,
-        },
-        call_id="toolu_dgm_test_001",
-    )
-    return CompletionResponse(
-        content="I will modify the agent.",
-        tool_calls=[tc],
-        finish_reason="tool_use",
-    )
-
+# Responses are never mutated by the agent loop, so build them once at import.
+# The edit path is relative so the edit tool resolves it inside the workspace.
+_EDIT_TOOL_RESPONSE = CompletionResponse(
+    content="I will modify the agent.",
+    tool_calls=[
+        ToolCall(
+            tool_name="edit",
+            parameters={
+                "action": "write",
+                "file_path": "agent.py",
+                "content": CHILD_AGENT_CODE,
+            },
+            call_id="toolu_dgm_test_001",
+        )
+    ],
+    finish_reason="tool_use",
+)
 
-def _terminal_response() -> CompletionResponse:
-    return CompletionResponse(
-        content="Modification complete. SOLUTION COMPLETE",
-        tool_calls=[],
-        finish_reason="end_turn",
-    )
+_TERMINAL_RESPONSE = CompletionResponse(
+    content="Modification complete. SOLUTION COMPLETE",
+    tool_calls=[],
+    finish_reason="end_turn",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -234,8 +228,8 @@ class TestDGMLoopIntegration:
                 async def fake_get_completion(request):
                     call_count["n"] += 1
                     if call_count["n"] == 1:
-                        return _edit_tool_response(workspace_dir / "agent.py")
-                    return _terminal_response()
+                        return _EDIT_TOOL_RESPONSE
+                    return _TERMINAL_RESPONSE
 
                 with patch(
                     "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
@@ -4,15 +4,21 @@ Unit tests for Agent, AgentConfig, Task, and the tool registry wiring.
 Uses pytest-asyncio (asyncio_mode = auto).  All network calls are monkeypatched.
 """
 
+import asyncio
+import dataclasses
+import functools
+import os
+import tempfile
+
 import pytest
 from pathlib import Path
-from unittest.mock import AsyncMock, patch, MagicMock
 
 from agent.agent import Agent, AgentConfig, Task, ToolExecutionEvent
 from agent.fm_interface.api_handler import (
-    ApiHandler, CompletionResponse, CompletionRequest, MessageRole, ToolCall
+    ApiHandler, CompletionResponse, MessageRole, ToolCall
 )
 from agent.fm_interface.message_formatter import ConversationContext
+from agent.fm_interface.providers.anthropic import AnthropicHandler
 from agent.fm_interface.providers.openai_compatible import OpenAICompatibleHandler
 from agent.tools.bash_tool import BashTool
 from agent.tools.base_tool import ToolExecutionStatus, ToolResult
@@ -36,12 +42,62 @@ def _make_config(tmp_path: Path, agent_id: str = "test_agent") -> AgentConfig:
     )
 
 
+# Terminal response template; tests clone it with their own content.
+_END_TURN = CompletionResponse(content="", tool_calls=[], finish_reason="end_turn")
+
+
 def _make_completion(content: str, tool_calls=None) -> CompletionResponse:
-    return CompletionResponse(
-        content=content,
-        tool_calls=tool_calls or [],
-        finish_reason="end_turn",
-    )
+    return dataclasses.replace(_END_TURN, content=content, tool_calls=tool_calls or [])
+
+
+_DONE_COMPLETION = _make_completion("Done. SOLUTION COMPLETE")
+
+# XML-style tool call a model sometimes emits as text instead of a real call.
+_PSEUDO_TOOL_CALL_TEXT = "<tool_call><function=edit>"
+
+
+class _CompletionStub:
+    """Scripted stand-in for ``get_completion``.
+
+    Mirrors the ``return_value``/``side_effect``/``await_count`` surface the
+    tests use, without AsyncMock's per-call bookkeeping.
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+        self.await_count = 0
+        self._scripted = None
+
+    def __call__(self, *args, **kwargs):
+        # Return an already-resolved future: awaiting it finishes at once,
+        # with no coroutine frame to create and drive for each call.
+        self.await_count += 1
+        future = asyncio.get_running_loop().create_future()
+        if isinstance(self.side_effect, BaseException):
+            future.set_exception(self.side_effect)
+        elif self.side_effect is not None:
+            if self._scripted is None:
+                self._scripted = iter(self.side_effect)
+            future.set_result(next(self._scripted))
+        else:
+            future.set_result(self.return_value)
+        return future
+
+
+@pytest.fixture
+def fm_stub(monkeypatch):
+    """Replace AnthropicHandler.get_completion with a scripted stub."""
+    stub = _CompletionStub()
+    monkeypatch.setattr(AnthropicHandler, "get_completion", stub)
+    return stub
+
+
+@pytest.fixture(scope="module")
+def shared_agent(tmpfs_root):
+    """One agent for tests that only inspect it; built once per module."""
+    with tempfile.TemporaryDirectory(dir=tmpfs_root, prefix="dgm_") as path:
+        yield Agent(_make_config(Path(path)))
 
 
 # ---------------------------------------------------------------------------
@@ -59,14 +115,12 @@ class TestAgentInit:
         assert isinstance(agent.working_directory, Path)
         assert agent.working_directory == tmp_path
 
-    def test_tools_registered(self, tmp_path):
-        agent = Agent(_make_config(tmp_path))
-        assert "bash" in agent.tool_registry._tools
-        assert "edit" in agent.tool_registry._tools
+    def test_tools_registered(self, shared_agent):
+        assert "bash" in shared_agent.tool_registry._tools
+        assert "edit" in shared_agent.tool_registry._tools
 
-    def test_bash_tool_is_bash_tool(self, tmp_path):
-        agent = Agent(_make_config(tmp_path))
-        assert isinstance(agent.tool_registry.get_tool("bash"), BashTool)
+    def test_bash_tool_is_bash_tool(self, shared_agent):
+        assert isinstance(shared_agent.tool_registry.get_tool("bash"), BashTool)
 
     def test_bash_tool_receives_sandbox_config(self, tmp_path):
         sandbox_manager = object()
@@ -96,13 +150,11 @@ class TestAgentInit:
         assert edit_tool.use_sandbox is True
         assert edit_tool.default_timeout == 17
 
-    def test_edit_tool_is_edit_tool(self, tmp_path):
-        agent = Agent(_make_config(tmp_path))
-        assert isinstance(agent.tool_registry.get_tool("edit"), EditTool)
+    def test_edit_tool_is_edit_tool(self, shared_agent):
+        assert isinstance(shared_agent.tool_registry.get_tool("edit"), EditTool)
 
-    def test_fm_handler_is_api_handler(self, tmp_path):
-        agent = Agent(_make_config(tmp_path))
-        assert isinstance(agent.fm_handler, ApiHandler)
+    def test_fm_handler_is_api_handler(self, shared_agent):
+        assert isinstance(shared_agent.fm_handler, ApiHandler)
 
     def test_openai_compatible_provider_supported(self, tmp_path):
         cfg = AgentConfig(
@@ -140,6 +192,24 @@ class TestAgentInit:
             initial_agent_code_snapshot=before,
         ) is None
 
+    def test_agent_code_snapshot_reuses_hash_only_for_settled_files(self, tmp_path):
+        agent = Agent(_make_config(tmp_path))
+        settled = tmp_path / "agent.py"
+        settled.write_text("A = 1\n", encoding="utf-8")
+        os.utime(settled, (1_000_000_000, 1_000_000_000))
+        fresh = tmp_path / "tools.py"
+        fresh.write_text("B = 1\n", encoding="utf-8")
+
+        before = agent._snapshot_agent_code_files()
+        assert settled in agent._code_hash_cache
+        assert fresh not in agent._code_hash_cache
+        assert agent._snapshot_agent_code_files() == before
+
+        settled.write_text("A = 2\n", encoding="utf-8")
+        after = agent._snapshot_agent_code_files()
+        assert after["agent.py"] != before["agent.py"]
+        assert after["tools.py"] == before["tools.py"]
+
     def test_required_tool_policy_releases_after_benchmark_solution(self, tmp_path):
         cfg = _make_config(tmp_path)
         cfg.fm_config = {**FM_CONFIG, "tool_choice_policy": "required_until_workspace_change"}
@@ -285,46 +355,34 @@ class TestAgentSolveTask:
     @pytest.fixture(autouse=True)
     def setup(self, tmp_path):
         self.tmp = tmp_path
-        self.agent = Agent(_make_config(tmp_path))
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_returns_dict_with_success(self, mock_gc):
-        mock_gc.return_value = _make_completion("Task complete.\n\nSOLUTION COMPLETE")
+    @functools.cached_property
+    def agent(self):
+        """Per-test agent, built only by the tests that use it."""
+        return Agent(_make_config(self.tmp))
+
+    async def test_solve_task_returns_dict_with_success(self, fm_stub):
+        fm_stub.return_value = _make_completion("Task complete.\n\nSOLUTION COMPLETE")
         task = Task(task_id="t1", description="Do something")
         result = await self.agent.solve_task(task)
         assert isinstance(result, dict)
         # solve_task catches exceptions internally; either success=True or success=False
         assert "success" in result or "task_id" in result
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_failure_returns_success_false(self, mock_gc):
-        mock_gc.side_effect = Exception("FM unavailable")
+    async def test_solve_task_failure_returns_success_false(self, fm_stub):
+        fm_stub.side_effect = Exception("FM unavailable")
         task = Task(task_id="t2", description="Fail task")
         result = await self.agent.solve_task(task)
         assert result.get("success") is False
         assert "FM unavailable" in result.get("error", "")
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_calls_fm_at_least_once(self, mock_gc):
-        mock_gc.return_value = _make_completion("Done. SOLUTION COMPLETE")
+    async def test_solve_task_calls_fm_at_least_once(self, fm_stub):
+        fm_stub.return_value = _DONE_COMPLETION
         task = Task(task_id="t3", description="Test")
         await self.agent.solve_task(task)
-        mock_gc.assert_called()
+        assert fm_stub.await_count
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_with_tool_call_round_trip(self, mock_gc):
+    async def test_solve_task_with_tool_call_round_trip(self, fm_stub):
         """FM returns a tool call, then a terminal response."""
         tool_call = ToolCall(
             tool_name="edit",
@@ -335,25 +393,21 @@ class TestAgentSolveTask:
             },
             call_id="toolu_001",
         )
-        mock_gc.side_effect = [
+        fm_stub.side_effect = [
             CompletionResponse(
                 content="I will write the file.",
                 tool_calls=[tool_call],
                 finish_reason="tool_use",
             ),
-            _make_completion("Done. SOLUTION COMPLETE"),
+            _DONE_COMPLETION,
         ]
         task = Task(task_id="t4", description="Write a file")
         result = await self.agent.solve_task(task)
         # The tool_call should have been executed (file written)
         assert (self.tmp / "out.txt").exists()
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_conversation_history_cleared_per_task(self, mock_gc):
-        mock_gc.return_value = _make_completion("Done. SOLUTION COMPLETE")
+    async def test_conversation_history_cleared_per_task(self, fm_stub):
+        fm_stub.return_value = _DONE_COMPLETION
         task_a = Task(task_id="a", description="Task A")
         task_b = Task(task_id="b", description="Task B")
         await self.agent.solve_task(task_a)
@@ -363,12 +417,8 @@ class TestAgentSolveTask:
         # Should not grow unboundedly from prior task
         assert len(self.agent.conversation_history) <= len_after_a + 10
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_respects_configured_max_iterations(self, mock_gc):
-        mock_gc.return_value = CompletionResponse(
+    async def test_solve_task_respects_configured_max_iterations(self, fm_stub):
+        fm_stub.return_value = CompletionResponse(
             content="I need to keep working.",
             tool_calls=[
                 ToolCall(
@@ -387,17 +437,13 @@ class TestAgentSolveTask:
         result = await agent.solve_task(task)
 
         assert result["success"] is True
-        assert mock_gc.await_count == 2
+        assert fm_stub.await_count == 2
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_reasks_after_empty_no_tool_response(self, mock_gc):
+    async def test_solve_task_reasks_after_empty_no_tool_response(self, fm_stub):
         cfg = _make_config(self.tmp)
         cfg.max_iterations = 3
         agent = Agent(cfg)
-        mock_gc.side_effect = [
+        fm_stub.side_effect = [
             CompletionResponse(
                 content="No response generated",
                 tool_calls=[],
@@ -419,22 +465,18 @@ class TestAgentSolveTask:
 
         assert result["success"] is True
         assert result["solution"] == "print('ok')"
-        assert mock_gc.await_count == 2
+        assert fm_stub.await_count == 2
         assert any(
             "previous response had no usable content" in msg.content
             for msg in agent.conversation_history
         )
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_returns_tool_written_solution_at_max_steps(self, mock_gc):
+    async def test_solve_task_returns_tool_written_solution_at_max_steps(self, fm_stub):
         cfg = _make_config(self.tmp)
         cfg.max_iterations = 2
         agent = Agent(cfg)
         solution = "print('ok')\n"
-        mock_gc.side_effect = [
+        fm_stub.side_effect = [
             CompletionResponse(
                 content="I will write the solution.",
                 tool_calls=[
@@ -468,18 +510,14 @@ class TestAgentSolveTask:
 
         assert result["success"] is True
         assert result["solution"] == solution
-        assert mock_gc.await_count == 2
+        assert fm_stub.await_count == 2
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_recovers_common_benchmark_solution_filename(self, mock_gc):
+    async def test_solve_task_recovers_common_benchmark_solution_filename(self, fm_stub):
         cfg = _make_config(self.tmp)
         cfg.max_iterations = 1
         agent = Agent(cfg)
         solution = "print('from solve')\n"
-        mock_gc.return_value = CompletionResponse(
+        fm_stub.return_value = CompletionResponse(
             content="I will write the solution.",
             tool_calls=[
                 ToolCall(
@@ -505,15 +543,11 @@ class TestAgentSolveTask:
         assert result["success"] is True
         assert result["solution"] == solution
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_does_not_recover_arbitrary_benchmark_python_file(self, mock_gc):
+    async def test_solve_task_does_not_recover_arbitrary_benchmark_python_file(self, fm_stub):
         cfg = _make_config(self.tmp)
         cfg.max_iterations = 1
         agent = Agent(cfg)
-        mock_gc.return_value = CompletionResponse(
+        fm_stub.return_value = CompletionResponse(
             content="I will explore the search space.",
             tool_calls=[
                 ToolCall(
@@ -539,13 +573,9 @@ class TestAgentSolveTask:
         assert result["success"] is True
         assert result["solution"] == ""
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
     async def test_benchmark_sample_mismatch_blocks_workspace_solution_fallback(
         self,
-        mock_gc,
+        fm_stub,
     ):
         cfg = _make_config(self.tmp)
         cfg.max_iterations = 3
@@ -563,7 +593,7 @@ class TestAgentSolveTask:
             ),
             metadata={"benchmark": "livecodebench_example"},
         )
-        mock_gc.side_effect = [
+        fm_stub.side_effect = [
             _make_completion(
                 "write wrong solution",
                 [
@@ -598,16 +628,12 @@ class TestAgentSolveTask:
         assert result["success"] is True
         assert result["solution"] == ""
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_solve_task_does_not_recover_agent_file_for_self_modification(self, mock_gc):
+    async def test_solve_task_does_not_recover_agent_file_for_self_modification(self, fm_stub):
         cfg = _make_config(self.tmp)
         cfg.max_iterations = 1
         agent = Agent(cfg)
         (self.tmp / "agent.py").write_text("print('not a benchmark answer')\n")
-        mock_gc.return_value = CompletionResponse(
+        fm_stub.return_value = CompletionResponse(
             content="I edited myself.",
             tool_calls=[],
             finish_reason="stop",
@@ -619,8 +645,8 @@ class TestAgentSolveTask:
         assert result["success"] is True
         assert result["solution"] == ""
 
-    def test_self_modification_system_message_includes_patch_mode(self):
-        system_message = self.agent._build_system_message(
+    def test_self_modification_system_message_includes_patch_mode(self, shared_agent):
+        system_message = shared_agent._build_system_message(
             ConversationContext(
                 task_id="self_modify_parent_001_1",
                 agent_id="agent_001",
@@ -636,11 +662,7 @@ class TestAgentSolveTask:
         assert "token-efficient" in system_message.content
         assert "Avoid changing `_is_task_complete`" in system_message.content
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_self_modification_read_only_loop_gets_patch_nudge(self, mock_gc):
+    async def test_self_modification_read_only_loop_gets_patch_nudge(self, fm_stub):
         cfg = _make_config(self.tmp)
         cfg.max_iterations = 3
         agent = Agent(cfg)
@@ -649,7 +671,7 @@ class TestAgentSolveTask:
             "    def __init__(self, config=None): pass\n",
             encoding="utf-8",
         )
-        mock_gc.return_value = CompletionResponse(
+        fm_stub.return_value = CompletionResponse(
             content="I will inspect more files.",
             tool_calls=[
                 ToolCall(
@@ -669,13 +691,13 @@ class TestAgentSolveTask:
         result = await agent.solve_task(task)
 
         assert result["success"] is True
-        assert mock_gc.await_count == 3
+        assert fm_stub.await_count == 3
         assert any(
             "SELF-MODIFICATION PATCH REQUIRED" in msg.content
             for msg in agent.conversation_history
         )
 
-    def test_self_modification_edit_error_gets_line_replace_repair_nudge(self):
+    def test_self_modification_edit_error_gets_line_replace_repair_nudge(self, shared_agent):
         task = Task(
             task_id="self_modify_parent_001_1",
             description="Modify yourself",
@@ -697,7 +719,7 @@ class TestAgentSolveTask:
             error="old_code not found in agent.py: no occurrences of the search text",
         )
 
-        nudge = self.agent._build_self_modification_edit_repair_nudge(
+        nudge = shared_agent._build_self_modification_edit_repair_nudge(
             tool_call,
             result,
             task,
@@ -709,7 +731,7 @@ class TestAgentSolveTask:
         assert "line_number" in nudge
         assert "content_lines" in nudge
 
-    def test_self_modification_syntax_error_gets_line_replace_repair_nudge(self):
+    def test_self_modification_syntax_error_gets_line_replace_repair_nudge(self, shared_agent):
         task = Task(
             task_id="self_modify_parent_001_1",
             description="Modify yourself",
@@ -735,7 +757,7 @@ class TestAgentSolveTask:
             ),
         )
 
-        nudge = self.agent._build_self_modification_edit_repair_nudge(
+        nudge = shared_agent._build_self_modification_edit_repair_nudge(
             tool_call,
             result,
             task,
@@ -747,7 +769,7 @@ class TestAgentSolveTask:
         assert "retry a smaller action='line_replace' patch" in nudge
         assert "named instruction block" in nudge
 
-    def test_benchmark_edit_error_gets_content_lines_repair_nudge(self):
+    def test_benchmark_edit_error_gets_content_lines_repair_nudge(self, shared_agent):
         task = Task(
             task_id="benchmark_livecodebench_example",
             description="Solve a benchmark",
@@ -768,7 +790,7 @@ class TestAgentSolveTask:
             error="content_lines parameter must contain only strings for write action",
         )
 
-        nudge = self.agent._build_edit_repair_nudge(tool_call, result, task)
+        nudge = shared_agent._build_edit_repair_nudge(tool_call, result, task)
 
         assert nudge is not None
         assert "BENCHMARK EDIT REPAIR" in nudge
@@ -776,7 +798,7 @@ class TestAgentSolveTask:
         assert "content_lines as a JSON array of plain strings" in nudge
         assert "Do not nest arrays or objects" in nudge
 
-    def test_nested_content_lines_are_tagged_as_malformed_edit(self):
+    def test_nested_content_lines_are_tagged_as_malformed_edit(self, shared_agent):
         tool_call = ToolCall(
             tool_name="edit",
             parameters={
@@ -795,11 +817,11 @@ class TestAgentSolveTask:
         )
 
         assert (
-            self.agent._classify_tool_failure(tool_call, result)
+            shared_agent._classify_tool_failure(tool_call, result)
             == "malformed edit"
         )
 
-    def test_python_syntax_edit_is_tagged_separately(self):
+    def test_python_syntax_edit_is_tagged_separately(self, shared_agent):
         tool_call = ToolCall(
             tool_name="edit",
             parameters={"action": "write", "file_path": "solution.py"},
@@ -811,11 +833,11 @@ class TestAgentSolveTask:
         )
 
         assert (
-            self.agent._classify_tool_failure(tool_call, result)
+            shared_agent._classify_tool_failure(tool_call, result)
             == "invalid Python"
         )
 
-    def test_benchmark_tool_registry_param_error_gets_repair_nudge(self):
+    def test_benchmark_tool_registry_param_error_gets_repair_nudge(self, shared_agent):
         task = Task(
             task_id="benchmark_livecodebench_example",
             description="Solve a benchmark",
@@ -836,14 +858,14 @@ class TestAgentSolveTask:
             error="Parameter 'content_lines' must be an array, got str",
         )
 
-        nudge = self.agent._build_edit_repair_nudge(tool_call, result, task)
+        nudge = shared_agent._build_edit_repair_nudge(tool_call, result, task)
 
         assert nudge is not None
         assert "BENCHMARK EDIT REPAIR" in nudge
         assert "content_lines as a JSON array of plain strings" in nudge
         assert "final Python code in a markdown python block" in nudge
 
-    def test_benchmark_unknown_edit_parameter_gets_repair_nudge(self):
+    def test_benchmark_unknown_edit_parameter_gets_repair_nudge(self, shared_agent):
         task = Task(
             task_id="benchmark_livecodebench_example",
             description="Solve a benchmark",
@@ -867,13 +889,13 @@ class TestAgentSolveTask:
             ),
         )
 
-        nudge = self.agent._build_edit_repair_nudge(tool_call, result, task)
+        nudge = shared_agent._build_edit_repair_nudge(tool_call, result, task)
 
         assert nudge is not None
         assert "BENCHMARK EDIT REPAIR" in nudge
         assert "complete solution.py" in nudge
 
-    def test_benchmark_solution_write_gets_constraint_verification_nudge(self):
+    def test_benchmark_solution_write_gets_constraint_verification_nudge(self, shared_agent):
         task = Task(
             task_id="benchmark_livecodebench_example",
             description="Solve a benchmark",
@@ -895,7 +917,7 @@ class TestAgentSolveTask:
             ),
         )
 
-        nudge = self.agent._build_benchmark_control_nudge(
+        nudge = shared_agent._build_benchmark_control_nudge(
             tool_events=[event],
             task=task,
             consumed_steps=1,
@@ -964,7 +986,7 @@ class TestAgentSolveTask:
         assert "Do not rewrite solution.py" in text
         assert "Task complete" in text
 
-    def test_benchmark_no_stdin_bash_failure_gets_repair_nudge(self):
+    def test_benchmark_no_stdin_bash_failure_gets_repair_nudge(self, shared_agent):
         task = Task(
             task_id="benchmark_livecodebench_example",
             description="Solve a benchmark",
@@ -983,7 +1005,7 @@ class TestAgentSolveTask:
             ),
         )
 
-        nudge = self.agent._build_benchmark_control_nudge(
+        nudge = shared_agent._build_benchmark_control_nudge(
             tool_events=[event],
             task=task,
             consumed_steps=3,
@@ -1053,7 +1075,7 @@ class TestAgentSolveTask:
         assert "runtime check" in text
         assert "re-run the failing check with explicit stdin" in text
 
-    def test_benchmark_sample_output_mismatch_is_detected(self):
+    def test_benchmark_sample_output_mismatch_is_detected(self, shared_agent):
         task = Task(
             task_id="benchmark_livecodebench_example",
             description=(
@@ -1079,8 +1101,8 @@ class TestAgentSolveTask:
             ),
         )
 
-        assert self.agent._events_include_benchmark_sample_mismatch([event], task)
-        assert not self.agent._events_include_verified_benchmark_sample_success(
+        assert shared_agent._events_include_benchmark_sample_mismatch([event], task)
+        assert not shared_agent._events_include_verified_benchmark_sample_success(
             [event],
             task,
         )
@@ -1187,7 +1209,7 @@ class TestAgentSolveTask:
         assert "BENCHMARK UNSAFE COMPLEXITY BLOCK" in text
         assert "Do not finalize from public samples alone" in text
 
-    def test_benchmark_timeout_parameter_is_not_timeout_evidence(self):
+    def test_benchmark_timeout_parameter_is_not_timeout_evidence(self, shared_agent):
         event = ToolExecutionEvent(
             tool_call=ToolCall(
                 tool_name="bash",
@@ -1204,9 +1226,9 @@ class TestAgentSolveTask:
             ),
         )
 
-        assert not self.agent._events_include_unsafe_benchmark_evidence([event])
+        assert not shared_agent._events_include_unsafe_benchmark_evidence([event])
 
-    def test_benchmark_timeout_result_remains_unsafe_evidence(self):
+    def test_benchmark_timeout_result_remains_unsafe_evidence(self, shared_agent):
         event = ToolExecutionEvent(
             tool_call=ToolCall(
                 tool_name="bash",
@@ -1223,9 +1245,9 @@ class TestAgentSolveTask:
             ),
         )
 
-        assert self.agent._events_include_unsafe_benchmark_evidence([event])
+        assert shared_agent._events_include_unsafe_benchmark_evidence([event])
 
-    def test_benchmark_repeated_edit_failures_get_fresh_source_reset(self):
+    def test_benchmark_repeated_edit_failures_get_fresh_source_reset(self, shared_agent):
         task = Task(
             task_id="benchmark_livecodebench_example",
             description="Solve a benchmark",
@@ -1248,7 +1270,7 @@ class TestAgentSolveTask:
             ),
         )
 
-        nudge = self.agent._build_benchmark_control_nudge(
+        nudge = shared_agent._build_benchmark_control_nudge(
             tool_events=[event],
             task=task,
             consumed_steps=3,
@@ -1273,8 +1295,8 @@ class TestAgentSolveTask:
         assert "flat JSON array" in text
         assert "whole solution.py" in text
 
-    def test_benchmark_system_message_rejects_brittle_shell_testing(self):
-        system_message = self.agent._build_system_message(
+    def test_benchmark_system_message_rejects_brittle_shell_testing(self, shared_agent):
+        system_message = shared_agent._build_system_message(
             ConversationContext(
                 task_id="benchmark_livecodebench_example",
                 agent_id="agent_001",
@@ -1286,9 +1308,9 @@ class TestAgentSolveTask:
         assert "Do not use `echo -e`" in system_message.content
         assert "Do not run `python3 solution.py` with no stdin" in system_message.content
 
-    def test_length_nudge_rejects_pseudo_tool_call_text(self):
+    def test_length_nudge_rejects_pseudo_tool_call_text(self, shared_agent):
         response = CompletionResponse(
-            content="<tool_call><function=edit>",
+            content=_PSEUDO_TOOL_CALL_TEXT,
             tool_calls=[],
             finish_reason="length",
         )
@@ -1298,21 +1320,17 @@ class TestAgentSolveTask:
             metadata={"benchmark": "livecodebench_example"},
         )
 
-        nudge = self.agent._build_no_progress_nudge(response, task)
+        nudge = shared_agent._build_no_progress_nudge(response, task)
 
         assert "Do not emit XML-like <tool_call> text" in nudge
         assert "real tool call" in nudge
 
-    @patch(
-        "agent.fm_interface.providers.anthropic.AnthropicHandler.get_completion",
-        new_callable=AsyncMock,
-    )
-    async def test_length_pseudo_tool_text_is_compacted_in_history(self, mock_gc):
+    async def test_length_pseudo_tool_text_is_compacted_in_history(self, fm_stub):
         cfg = _make_config(self.tmp)
         cfg.max_iterations = 1
         agent = Agent(cfg)
-        pseudo_tool_text = "<tool_call><function=edit>" + ("x" * 5000)
-        mock_gc.return_value = CompletionResponse(
+        pseudo_tool_text = _PSEUDO_TOOL_CALL_TEXT + ("x" * 5000)
+        fm_stub.return_value = CompletionResponse(
             content=pseudo_tool_text,
             tool_calls=[],
             finish_reason="length",
@@ -2,6 +2,9 @@
 Tests for the Agent._extract_code_solution helper.
 """
 
+import tempfile
+from pathlib import Path
+
 import pytest
 from agent.agent import Agent, AgentConfig
 
@@ -23,37 +26,67 @@ def _make_agent(tmp_path):
     return Agent(cfg)
 
 
-class TestExtractCodeSolution:
+@pytest.fixture(scope="module")
+def agent(tmpfs_root):
+    """Extraction is stateless, so one agent serves the whole module."""
+    with tempfile.TemporaryDirectory(dir=tmpfs_root, prefix="dgm_") as path:
+        yield _make_agent(Path(path))
 
-    def test_extracts_python_code_block(self, tmp_path):
-        agent = _make_agent(tmp_path)
-        response = "Here is the solution:\n```python\ndef add(a, b):\n    return a + b\n```"
-        code = agent._extract_code_solution(response)
-        assert "def add" in code
 
-    def test_extracts_plain_code_block(self, tmp_path):
-        agent = _make_agent(tmp_path)
-        response = "Solution:\n```\ndef f(): pass\n```"
-        code = agent._extract_code_solution(response)
-        assert "def f" in code
-
-    def test_extracts_last_block_when_multiple(self, tmp_path):
-        agent = _make_agent(tmp_path)
-        response = (
-            "```python\ndef helper(): pass\n```\n"
-            "Final:\n```python\ndef solution(): return 42\n```"
-        )
-        code = agent._extract_code_solution(response)
-        assert "solution" in code
+# (response, expected extracted code) pairs, one per extraction path.
+EXTRACTION_CASES = [
+    pytest.param(
+        "Here is the solution:\n```python\ndef add(a, b):\n    return a + b\n```",
+        "def add(a, b):\n    return a + b",
+        id="python_code_block",
+    ),
+    pytest.param(
+        "Solution:\n```\ndef f(): pass\n```",
+        "def f(): pass",
+        id="plain_code_block",
+    ),
+    pytest.param(
+        "```python\ndef helper(): pass\n```\n"
+        "Final:\n```python\ndef solution(): return 42\n```",
+        "def solution(): return 42",
+        id="last_block_when_multiple",
+    ),
+    pytest.param(
+        "```python\ndef solution(): return 42\n```\n"
+        "Wrap it in ``` when you reuse it.",
+        "def solution(): return 42",
+        id="stray_trailing_fence",
+    ),
+    pytest.param(
+        "```python\nA = 1\n```\nthen\n```python\nB = 2",
+        "A = 1",
+        id="truncated_final_block",
+    ),
+    pytest.param(
+        "```python\nA = 1\n```\n```python\nB = 2\n```\n```python\nC = 3",
+        "B = 2",
+        id="truncated_block_after_pairs",
+    ),
+    pytest.param(
+        "Here is my answer.\ndef solve(n):\n\n    return n * 2\nThat doubles the input.",
+        "def solve(n):\n\n    return n * 2",
+        id="unfenced_fallback",
+    ),
+]
+
+
+class TestExtractCodeSolution:
+
+    @pytest.mark.parametrize("response,expected", EXTRACTION_CASES)
+    def test_extracts_code(self, agent, response, expected):
+        assert agent._extract_code_solution(response) == expected
 
-    def test_no_code_block_returns_string(self, tmp_path):
-        agent = _make_agent(tmp_path)
+    def test_no_code_block_returns_string(self, agent):
         # No markdown block; should return something (possibly empty)
         response = "I could not solve this problem."
         code = agent._extract_code_solution(response)
         assert isinstance(code, str)
 
-    def test_empty_response_returns_string(self, tmp_path):
-        agent = _make_agent(tmp_path)
+    def test_empty_response_returns_string(self, agent):
         code = agent._extract_code_solution("")
         assert isinstance(code, str)
@@ -0,0 +1,55 @@
+"""
+Unit tests for utils.agent_loader.AgentLoader.
+"""
+
+import os
+import sys
+
+import pytest
+
+from utils.agent_loader import AgentLoader
+
+
+@pytest.fixture
+def archived_agent(tmp_path, monkeypatch):
+    """An archive-style agent.py, with sys.path and sys.modules restored after."""
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    agent_file = tmp_path / "archive" / "loader_cache_agent" / "agent.py"
+    agent_file.parent.mkdir(parents=True)
+    agent_file.write_text("class Agent:\n    version = 1\n")
+    yield agent_file
+    AgentLoader.invalidate(agent_file)
+    sys.modules.pop("archived_agent_loader_cache_agent", None)
+
+
+def test_load_from_archive_reuses_class_for_unchanged_file(archived_agent):
+    first = AgentLoader().load_from_archive(archived_agent)
+    assert AgentLoader().load_from_archive(archived_agent) is first
+
+
+def test_load_from_archive_reloads_changed_or_invalidated_file(archived_agent):
+    first = AgentLoader().load_from_archive(archived_agent)
+
+    AgentLoader.invalidate(archived_agent)
+    assert AgentLoader().load_from_archive(archived_agent) is not first
+
+    archived_agent.write_text("class Agent:\n    version = 22\n")
+    st = archived_agent.stat()
+    os.utime(archived_agent, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert AgentLoader().load_from_archive(archived_agent).version == 22
+
+
+def test_load_from_archive_logs_missing_file(tmp_path, caplog):
+    missing = tmp_path / "archive" / "gone" / "agent.py"
+    with pytest.raises(FileNotFoundError):
+        AgentLoader().load_from_archive(missing)
+    assert "Failed to load agent" in caplog.text
+
+
+def test_cleanup_paths_removes_only_archive_entries(tmp_path, monkeypatch):
+    root = tmp_path / "archive_project"
+    monkeypatch.setattr(
+        sys, "path", ["/opt/lib", "/data/archive/a1", str(root), "/data/archive/a1"]
+    )
+    AgentLoader(project_root=root).cleanup_paths()
+    assert sys.path == ["/opt/lib", str(root)]
@@ -4,7 +4,6 @@ Tests for API handler validation logic (no real network calls).
 
 import pytest
 from agent.fm_interface.providers.anthropic import AnthropicHandler
-from agent.fm_interface.api_handler import ApiError
 
 
 class TestAnthropicHandlerValidation:
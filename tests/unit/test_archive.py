@@ -7,10 +7,11 @@ Covers the real APIs after the fixer rewrites:
     empty / all-invalid archive
 """
 
+import json
 import math
 import random
-import shutil
-import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -134,6 +135,48 @@ class TestAgentArchive:
         assert reloaded_a2.parent_id == a1.agent_id
         assert reloaded_a2.average_score == pytest.approx(0.9)
 
+    def test_add_agents_saves_once_and_round_trips(self, tmp_path, monkeypatch):
+        arc_dir = tmp_path / "arc"
+        archive = AgentArchive(archive_dir=str(arc_dir))
+        saves = []
+        original_save = archive._save_archive
+        monkeypatch.setattr(archive, "_save_archive", lambda: (saves.append(1), original_save()))
+
+        files = [_make_agent_file(tmp_path, f"a{i}.py") for i in range(3)]
+        added = archive.add_agents([
+            {"agent_path": str(f), "benchmark_scores": {"b": 0.2 * (i + 1)}}
+            for i, f in enumerate(files)
+        ])
+
+        assert len(saves) == 1
+        assert [a.average_score for a in added] == pytest.approx([0.2, 0.4, 0.6])
+        archive2 = AgentArchive(archive_dir=str(arc_dir))
+        assert set(archive2.agents) == {a.agent_id for a in added}
+        assert archive.add_agents([]) == []
+        assert len(saves) == 1
+
+    def test_loads_legacy_non_finite_tokens(self, tmp_path):
+        """Metadata written by stdlib json with NaN/Infinity still loads."""
+        arc_dir = tmp_path / "arc"
+        arc_dir.mkdir()
+        legacy = _archived_agent("legacy", None, 0, 0.5).to_dict()
+        legacy["benchmark_scores"] = {"b": math.nan, "c": math.inf}
+        (arc_dir / "archive_metadata.json").write_text(json.dumps({"agents": {"legacy": legacy}}))
+
+        archive = AgentArchive(archive_dir=str(arc_dir))
+        scores = archive.agents["legacy"].benchmark_scores
+        assert math.isnan(scores["b"]) and scores["c"] == math.inf
+
+    def test_non_finite_scores_round_trip(self, tmp_path):
+        arc_dir = tmp_path / "arc"
+        archive = AgentArchive(archive_dir=str(arc_dir))
+        agent = _add_agent(
+            archive, _make_agent_file(tmp_path),
+            benchmark_scores={"b": math.nan, "c": math.inf},
+        )
+        scores = AgentArchive(archive_dir=str(arc_dir)).agents[agent.agent_id].benchmark_scores
+        assert math.isnan(scores["b"]) and scores["c"] == math.inf
+
     def test_atomic_save_metadata_file_exists(self, tmp_path):
         """Verify _save_archive writes the metadata file (atomicity mechanism present)."""
         arc_dir = tmp_path / "arc"
@@ -173,6 +216,20 @@ class TestAgentArchive:
         assert top[1].average_score == pytest.approx(0.8)
         assert top[2].average_score == pytest.approx(0.7)
 
+    def test_get_top_agents_skips_invalid_and_keeps_tie_order(self, tmp_path):
+        archive = AgentArchive(archive_dir=str(tmp_path / "arc"))
+        for agent in (
+            _archived_agent("first", None, 0, 0.6),
+            _archived_agent("invalid", None, 0, 0.95, is_valid=False),
+            _archived_agent("second", None, 1, 0.6),
+            _archived_agent("best", None, 1, 0.8),
+        ):
+            archive.agents[agent.agent_id] = agent
+
+        top = archive.get_top_agents(n=3)
+        assert [a.agent_id for a in top] == ["best", "first", "second"]
+        assert archive.get_top_agents(n=0) == []
+
     def test_get_agent_lineage(self, tmp_path):
         archive = AgentArchive(archive_dir=str(tmp_path / "arc"))
         fa = _make_agent_file(tmp_path, "gp.py")
@@ -188,6 +245,28 @@ class TestAgentArchive:
         assert lineage[1].agent_id == p.agent_id
         assert lineage[2].agent_id == c.agent_id
 
+    def test_archive_statistics(self, tmp_path):
+        archive = AgentArchive(archive_dir=str(tmp_path / "arc"))
+        assert archive.get_archive_statistics() == {
+            'total_agents': 0, 'valid_agents': 0, 'average_score': 0,
+            'best_score': 0, 'worst_score': 0, 'max_generation': 0,
+        }
+
+        root = _add_agent(archive, _make_agent_file(tmp_path, "r.py"), benchmark_scores={"b": 0.5})
+        child = _add_agent(archive, _make_agent_file(tmp_path, "c.py"),
+                           parent_id=root.agent_id, benchmark_scores={"b": 0.9})
+        _add_agent(archive, _make_agent_file(tmp_path, "g.py"), parent_id=child.agent_id,
+                   benchmark_scores={"b": 1.0}, is_valid=False)
+        _add_agent(archive, _make_agent_file(tmp_path, "o.py"), benchmark_scores={"b": 0.1})
+
+        stats = archive.get_archive_statistics()
+        assert stats['total_agents'] == 4
+        assert stats['valid_agents'] == 3
+        assert stats['average_score'] == pytest.approx(0.5)
+        assert stats['best_score'] == pytest.approx(0.9)
+        assert stats['worst_score'] == pytest.approx(0.1)
+        assert stats['max_generation'] == 2
+
     def test_valid_children_counting(self, tmp_path):
         """Children of an agent increment get_agent_children."""
         archive = AgentArchive(archive_dir=str(tmp_path / "arc"))
@@ -258,16 +337,19 @@ class TestParentSelector:
         """
         arc_dir = tmp_path / "arc"
         archive = AgentArchive(archive_dir=str(arc_dir))
-        agents = []
-        for i, (score, parent_id, is_valid) in enumerate(agent_specs):
-            f = _make_agent_file(tmp_path, f"a{i}.py")
-            a = archive.add_agent(
-                agent_path=str(f),
-                parent_id=parent_id,
-                benchmark_scores={"b": score},
-                is_valid=is_valid,
-            )
-            agents.append(a)
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            files = list(ex.map(
+                lambda i: _make_agent_file(tmp_path, f"a{i}.py"), range(len(agent_specs))
+            ))
+        agents = archive.add_agents([
+            {
+                "agent_path": str(f),
+                "parent_id": parent_id,
+                "benchmark_scores": {"b": score},
+                "is_valid": is_valid,
+            }
+            for f, (score, parent_id, is_valid) in zip(files, agent_specs)
+        ])
         return archive, agents
 
     def test_weight_math_three_agents(self, tmp_path):
@@ -309,9 +391,8 @@ class TestParentSelector:
         random.seed(42)
         counts = {agent_a.agent_id: 0, agent_b.agent_id: 0, agent_c.agent_id: 0}
         n = 10_000
-        for _ in range(n):
-            chosen = selector.select_parents(archive, n_parents=1)
-            counts[chosen[0].agent_id] += 1
+        for chosen in selector.sample_parents(archive, n):
+            counts[chosen.agent_id] += 1
 
         eligible = [agent_a, agent_b, agent_c]
         for agent, expected_p in zip(eligible, expected_probs):
@@ -323,9 +404,14 @@ class TestParentSelector:
     def test_sampling_without_replacement_returns_distinct(self, tmp_path):
         arc_dir = tmp_path / "arc"
         archive = AgentArchive(archive_dir=str(arc_dir))
-        for i in range(5):
-            f = _make_agent_file(tmp_path, f"a{i}.py")
-            archive.add_agent(str(f), benchmark_scores={"b": 0.1 * (i + 1)}, is_valid=True)
+        # Fixture files are independent, so write them concurrently and
+        # register them with a single metadata save.
+        with ThreadPoolExecutor(max_workers=5) as ex:
+            files = list(ex.map(lambda i: _make_agent_file(tmp_path, f"a{i}.py"), range(5)))
+        archive.add_agents([
+            {"agent_path": str(f), "benchmark_scores": {"b": 0.1 * (i + 1)}, "is_valid": True}
+            for i, f in enumerate(files)
+        ])
 
         selector = ParentSelector()
         random.seed(7)
@@ -372,14 +458,46 @@ class TestParentSelector:
         selector = ParentSelector()
         random.seed(0)
         counts = {high.agent_id: 0, low.agent_id: 0}
-        for _ in range(1000):
-            chosen = selector.select_parents(archive, n_parents=1)
-            counts[chosen[0].agent_id] += 1
+        for chosen in selector.sample_parents(archive, 1000):
+            counts[chosen.agent_id] += 1
 
         assert counts[high.agent_id] > counts[low.agent_id] * 3, (
             "High-score agent should dominate selection"
         )
 
+    def test_sample_parents_matches_single_draw_distribution(self, tmp_path):
+        archive, agents = self._build_archive_with_agents(
+            tmp_path, [(0.9, None, True), (0.4, None, True), (0.2, None, False)]
+        )
+        selector = ParentSelector()
+
+        random.seed(3)
+        batched = Counter(a.agent_id for a in selector.sample_parents(archive, 2000))
+        random.seed(3)
+        single = Counter(
+            selector.select_parents(archive, n_parents=1)[0].agent_id
+            for _ in range(2000)
+        )
+
+        assert agents[2].agent_id not in batched
+        for agent in agents[:2]:
+            assert abs(batched[agent.agent_id] - single[agent.agent_id]) / 2000 < 0.05
+
+    def test_sample_parents_honours_elite_probability(self, tmp_path):
+        archive, agents = self._build_archive_with_agents(
+            tmp_path, [(0.9, None, True), (0.1, None, True)]
+        )
+        selector = ParentSelector(elite_selection_probability=1.0)
+
+        drawn = selector.sample_parents(archive, 20)
+
+        assert len(drawn) == 20
+        assert {a.agent_id for a in drawn} == {agents[0].agent_id}
+
+    def test_sample_parents_empty_archive(self, tmp_path):
+        archive = AgentArchive(archive_dir=str(tmp_path / "arc"))
+        assert ParentSelector().sample_parents(archive, 5) == []
+
     def test_invalid_agents_excluded_from_selection(self, tmp_path):
         archive = AgentArchive(archive_dir=str(tmp_path / "arc"))
         fv = _make_agent_file(tmp_path, "valid.py")
@@ -526,6 +644,35 @@ class TestParentSelector:
         assert selected == [high]
         assert low.agent_id != selected[0].agent_id
 
+    def test_tournament_covering_archive_picks_highest_weight(self, tmp_path):
+        archive, agents = self._build_archive_with_agents(
+            tmp_path, [(0.3, None, True), (0.8, None, True), (0.6, None, True)]
+        )
+        selector = ParentSelector(tournament_size=3)
+
+        random.seed(4)
+        assert selector.select_parents(archive, n_parents=1) == [agents[1]]
+        assert {a.agent_id for a in selector.sample_parents(archive, 10)} == {
+            agents[1].agent_id
+        }
+
+    def test_tournament_weight_penalises_prolific_parent(self, tmp_path):
+        # Parent scores higher, but its two valid children cut h_i to 1/3.
+        archive, agents = self._build_archive_with_agents(
+            tmp_path, [(0.6, None, True), (0.55, None, True)]
+        )
+        for i in range(2):
+            archive.add_agent(
+                str(_make_agent_file(tmp_path, f"child{i}.py")),
+                parent_id=agents[0].agent_id,
+                benchmark_scores={"b": 0.1},
+                is_valid=True,
+            )
+        selector = ParentSelector(tournament_size=4)
+
+        random.seed(5)
+        assert selector.select_parents(archive, n_parents=1) == [agents[1]]
+
     def test_elite_selection_probability_prefers_earlier_generation_on_score_tie(self, tmp_path):
         archive = AgentArchive(archive_dir=str(tmp_path / "arc"))
         parent = archive.add_agent(
@@ -0,0 +1,117 @@
+"""
+Unit tests for utils.config_loader.ConfigLoader.
+"""
+
+import os
+import time
+
+import pytest
+
+import utils.config_loader as config_module
+from utils.config_loader import ConfigLoader
+
+
+def _write_config(path, text):
+    path.write_text(text)
+    return ConfigLoader(str(path))
+
+
+def _age(path, seconds=60):
+    """Backdate *path* past the cache's racy-mtime window."""
+    past = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+def test_load_substitutes_env_vars(tmp_path, monkeypatch):
+    monkeypatch.setenv("DGM_TEST_MODEL", "model-x")
+    loader = _write_config(
+        tmp_path / "cfg.yaml",
+        "fm_providers:\n  primary: anthropic\n  anthropic:\n    model: ${DGM_TEST_MODEL}\n"
+        "    api_key: ${DGM_TEST_UNSET_KEY}\n",
+    )
+    config = loader.load()
+    assert config["fm_providers"]["anthropic"]["model"] == "model-x"
+    assert config["fm_providers"]["anthropic"]["api_key"] == "${DGM_TEST_UNSET_KEY}"
+
+
+def test_load_returns_independent_copies(tmp_path):
+    loader = _write_config(tmp_path / "cfg.yaml", "fm_providers:\n  primary: gemini\n")
+    first = loader.load()
+    first["fm_providers"]["primary"] = "mutated"
+    assert loader.load()["fm_providers"]["primary"] == "gemini"
+
+
+def test_load_rereads_changed_file(tmp_path):
+    path = tmp_path / "cfg.yaml"
+    loader = _write_config(path, "fm_providers:\n  primary: gemini\n")
+    assert loader.get_primary_provider() == "gemini"
+    path.write_text("fm_providers:\n  primary: anthropic\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert loader.get_primary_provider() == "anthropic"
+
+
+def test_module_config_loader_is_lazy_singleton():
+    loader = config_module.get_config_loader()
+    assert config_module.config_loader is loader
+    assert config_module.get_config_loader() is loader
+
+
+def test_get_fm_config_returns_provider_copy(tmp_path):
+    loader = _write_config(
+        tmp_path / "cfg.yaml",
+        "fm_providers:\n  anthropic:\n    api_key: real-key\n    model: m1\n",
+    )
+    fm_config = loader.get_fm_config("anthropic")
+    assert fm_config == {"api_key": "real-key", "model": "m1"}
+    fm_config["model"] = "mutated"
+    assert loader.get_fm_config("anthropic")["model"] == "m1"
+
+
+def test_env_var_set_after_first_load_is_picked_up(tmp_path, monkeypatch):
+    monkeypatch.delenv("DGM_TEST_LATE_KEY", raising=False)
+    path = tmp_path / "cfg.yaml"
+    loader = _write_config(
+        path, "fm_providers:\n  anthropic:\n    api_key: ${DGM_TEST_LATE_KEY}\n"
+    )
+    _age(path)
+    with pytest.raises(ValueError, match="not set"):
+        loader.get_fm_config("anthropic")
+
+    monkeypatch.setenv("DGM_TEST_LATE_KEY", "late-key")
+    assert loader.get_fm_config("anthropic")["api_key"] == "late-key"
+    assert loader.load()["fm_providers"]["anthropic"]["api_key"] == "late-key"
+
+
+def test_env_values_parse_as_typed_scalars(tmp_path, monkeypatch):
+    monkeypatch.setenv("DGM_TEST_MAX_TOKENS", "4096")
+    monkeypatch.setenv("DGM_TEST_STREAM", "true")
+    loader = _write_config(
+        tmp_path / "cfg.yaml",
+        "fm:\n  max_tokens: ${DGM_TEST_MAX_TOKENS}\n  stream: ${DGM_TEST_STREAM}\n",
+    )
+    assert loader.load()["fm"] == {"max_tokens": 4096, "stream": True}
+
+
+def test_settled_file_is_parsed_once(tmp_path, monkeypatch):
+    path = tmp_path / "cfg.yaml"
+    loader = _write_config(path, "fm_providers:\n  primary: gemini\n")
+    _age(path)
+    assert loader.get_primary_provider() == "gemini"
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("settled config was parsed again")
+
+    monkeypatch.setattr(config_module.yaml, "load", fail_load)
+    assert loader.load()["fm_providers"]["primary"] == "gemini"
+
+
+def test_recently_modified_file_is_not_cached(tmp_path):
+    path = tmp_path / "cfg.yaml"
+    loader = _write_config(path, "fm_providers:\n  primary: gemini\n")
+    assert loader.get_primary_provider() == "gemini"
+    # Same size and same mtime_ns: only the race-window guard catches this.
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text("fm_providers:\n  primary: openai\n")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert loader.get_primary_provider() == "openai"
@@ -9,19 +9,29 @@ from pathlib import Path
 from types import SimpleNamespace
 
 
+# Serialized fixtures shared by every test; encoded once at import.
+_DUMMY_BENCHMARK_YAML = yaml.dump({
+    "name": "dummy",
+    "description": "dummy",
+    "task_prompt": "dummy",
+    "test_cases": [
+        {"function_name": "f", "inputs": ["1"], "expected_outputs": ["1"]}
+    ],
+    "timeout": 5,
+    "scoring_method": "pass_fail",
+})
+
+_SANDBOX_WROTE_AGENT_OUTPUT = json.dumps({
+    "status": "success",
+    "output": "wrote agent.py",
+    "error": "",
+})
+
+
 def _minimal_config(tmp_path: Path) -> dict:
     bench_dir = tmp_path / "benchmarks"
     bench_dir.mkdir()
-    (bench_dir / "dummy.yaml").write_text(yaml.dump({
-        "name": "dummy",
-        "description": "dummy",
-        "task_prompt": "dummy",
-        "test_cases": [
-            {"function_name": "f", "inputs": ["1"], "expected_outputs": ["1"]}
-        ],
-        "timeout": 5,
-        "scoring_method": "pass_fail",
-    }))
+    (bench_dir / "dummy.yaml").write_text(_DUMMY_BENCHMARK_YAML)
     for d in ("archive", "results", "workspace"):
         (tmp_path / d).mkdir()
     initial = tmp_path / "agent.py"
@@ -376,11 +386,7 @@ class TestDGMControllerInit:
                 })
                 return SandboxResult(
                     success=True,
-                    output=json.dumps({
-                        "status": "success",
-                        "output": "wrote agent.py",
-                        "error": "",
-                    }),
+                    output=_SANDBOX_WROTE_AGENT_OUTPUT,
                     exit_code=0,
                     execution_time=0.1,
                 )
@@ -7,13 +7,14 @@ directly with hand-written Python solutions in tmp_path.
 """
 
 import asyncio
+import json
+import tempfile
 import pytest
 import yaml
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import evaluation.benchmark_runner as benchmark_runner_module
-from evaluation.benchmark_runner import BenchmarkRunner, BenchmarkTask, BenchmarkResult
+from evaluation.benchmark_runner import BenchmarkRunner, BenchmarkTask
 from evaluation.scorer import (
     BenchmarkScorer, BinaryScorer, PartialCreditScorer,
     JsonScorer, FunctionOutputScorer
@@ -26,48 +27,57 @@ from sandbox.sandbox_manager import SandboxManager, SandboxResult
 # BenchmarkTask helpers
 # ---------------------------------------------------------------------------
 
-def _make_task(tmp_path: Path, name: str = "add_task") -> BenchmarkTask:
-    """Write a YAML benchmark config and return a BenchmarkTask."""
-    config = {
-        "name": name,
-        "description": "Add two numbers",
-        "task_prompt": "Write a function add(a, b) that returns a+b",
-        "test_cases": [
-            {
-                "function_name": "add",
-                "inputs": ["1, 2", "10, 20", "-1, 1"],
-                "expected_outputs": ["3", "30", "0"],
-            }
-        ],
-        "timeout": 10,
-        "scoring_method": "partial",
-    }
-    p = tmp_path / f"{name}.yaml"
-    p.write_text(yaml.dump(config))
-    return BenchmarkTask.from_config(str(p))
+# Benchmark configs shared by most runner tests, serialized once at import.
+_ADD_TASK_CONFIG = {
+    "name": "add_task",
+    "description": "Add two numbers",
+    "task_prompt": "Write a function add(a, b) that returns a+b",
+    "test_cases": [
+        {
+            "function_name": "add",
+            "inputs": ["1, 2", "10, 20", "-1, 1"],
+            "expected_outputs": ["3", "30", "0"],
+        }
+    ],
+    "timeout": 10,
+    "scoring_method": "partial",
+}
+_STDIN_TASK_CONFIG = {
+    "name": "stdin_sum_task",
+    "description": "Sum numbers from stdin",
+    "task_prompt": "Read integers from stdin and print their sum.",
+    "test_cases": [
+        {
+            "testtype": "stdin",
+            "inputs": ["3\n1 2 3\n", "2\n4 5\n"],
+            "expected_outputs": ["6\n", "9\n"],
+        }
+    ],
+    "timeout": 10,
+    "scoring_method": "partial",
+}
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_ADD_TASK_YAML = yaml.dump(_ADD_TASK_CONFIG, Dumper=_YAML_DUMPER)
+_STDIN_TASK_YAML = yaml.dump(_STDIN_TASK_CONFIG, Dumper=_YAML_DUMPER)
 
 
-def _make_stdin_task(tmp_path: Path, name: str = "stdin_sum_task") -> BenchmarkTask:
-    """Write a stdin/stdout benchmark config and return a BenchmarkTask."""
-    config = {
-        "name": name,
-        "description": "Sum numbers from stdin",
-        "task_prompt": "Read integers from stdin and print their sum.",
-        "test_cases": [
-            {
-                "testtype": "stdin",
-                "inputs": ["3\n1 2 3\n", "2\n4 5\n"],
-                "expected_outputs": ["6\n", "9\n"],
-            }
-        ],
-        "timeout": 10,
-        "scoring_method": "partial",
-    }
+def _write_task(tmp_path: Path, name: str, text: str) -> BenchmarkTask:
+    """Write a serialized benchmark config and return its BenchmarkTask."""
     p = tmp_path / f"{name}.yaml"
-    p.write_text(yaml.dump(config))
+    p.write_text(text)
     return BenchmarkTask.from_config(str(p))
 
 
+def _make_task(tmp_path: Path) -> BenchmarkTask:
+    """Write the add_task benchmark config and return a BenchmarkTask."""
+    return _write_task(tmp_path, _ADD_TASK_CONFIG["name"], _ADD_TASK_YAML)
+
+
+def _make_stdin_task(tmp_path: Path) -> BenchmarkTask:
+    """Write the stdin/stdout benchmark config and return a BenchmarkTask."""
+    return _write_task(tmp_path, _STDIN_TASK_CONFIG["name"], _STDIN_TASK_YAML)
+
+
 def _make_runner(tmp_path: Path, task: BenchmarkTask) -> BenchmarkRunner:
     """Build a BenchmarkRunner whose benchmarks dir contains only task."""
     bdir = tmp_path / "benchmarks"
@@ -80,10 +90,26 @@ def _make_runner(tmp_path: Path, task: BenchmarkTask) -> BenchmarkRunner:
         "timeout": task.timeout,
         "scoring_method": task.scoring_method,
     }
-    (bdir / f"{task.name}.yaml").write_text(yaml.dump(cfg))
+    (bdir / f"{task.name}.yaml").write_text(yaml.dump(cfg, Dumper=_YAML_DUMPER))
     return BenchmarkRunner(benchmarks_dir=str(bdir), use_sandbox=False)
 
 
+@pytest.fixture(scope="module")
+def add_runner(tmpfs_root):
+    """(task, runner) for add_task; built once for tests that only run cases."""
+    with tempfile.TemporaryDirectory(dir=tmpfs_root, prefix="dgm_") as path:
+        task = _make_task(Path(path))
+        yield task, _make_runner(Path(path), task)
+
+
+@pytest.fixture(scope="module")
+def stdin_runner(tmpfs_root):
+    """(task, runner) for stdin_sum_task; built once for tests that only run cases."""
+    with tempfile.TemporaryDirectory(dir=tmpfs_root, prefix="dgm_") as path:
+        task = _make_stdin_task(Path(path))
+        yield task, _make_runner(Path(path), task)
+
+
 def test_runner_loads_only_enabled_benchmarks(tmp_path):
     bdir = tmp_path / "benchmarks"
     bdir.mkdir()
@@ -231,26 +257,23 @@ class TestBuildTestScript:
 
 class TestRunTestCase:
 
-    async def test_correct_solution_all_pass(self, tmp_path):
-        task = _make_task(tmp_path)
-        runner = _make_runner(tmp_path, task)
+    async def test_correct_solution_all_pass(self, add_runner):
+        task, runner = add_runner
         solution = "def add(a, b):\n    return a + b\n"
         result = await runner._run_test_case(solution, task.test_cases[0], task)
         assert result["success"] is True
         assert result["passed"] == result["total"] == 3
 
-    async def test_wrong_solution_all_fail(self, tmp_path):
-        task = _make_task(tmp_path)
-        runner = _make_runner(tmp_path, task)
+    async def test_wrong_solution_all_fail(self, add_runner):
+        task, runner = add_runner
         solution = "def add(a, b):\n    return a * b\n"  # wrong
         result = await runner._run_test_case(solution, task.test_cases[0], task)
         assert result["success"] is False
         assert result["passed"] < result["total"]
 
-    async def test_invalid_function_name_blocked(self, tmp_path):
+    async def test_invalid_function_name_blocked(self, add_runner):
         """function_name with spaces/special chars should be rejected."""
-        task = _make_task(tmp_path)
-        runner = _make_runner(tmp_path, task)
+        task, runner = add_runner
         bad_test_case = {
             "function_name": "add; import os",
             "inputs": ["1, 2"],
@@ -260,9 +283,8 @@ class TestRunTestCase:
         assert result["success"] is False
         assert "Invalid function_name" in result.get("error", "")
 
-    async def test_stdin_solution_all_pass(self, tmp_path):
-        task = _make_stdin_task(tmp_path)
-        runner = _make_runner(tmp_path, task)
+    async def test_stdin_solution_all_pass(self, stdin_runner):
+        task, runner = stdin_runner
         solution = (
             "import sys\n"
             "def main():\n"
@@ -275,9 +297,8 @@ class TestRunTestCase:
         assert result["success"] is True
         assert result["passed"] == result["total"] == 2
 
-    async def test_stdin_wrong_solution_fails(self, tmp_path):
-        task = _make_stdin_task(tmp_path)
-        runner = _make_runner(tmp_path, task)
+    async def test_stdin_wrong_solution_fails(self, stdin_runner):
+        task, runner = stdin_runner
         solution = (
             "import sys\n"
             "data = list(map(int, sys.stdin.read().split()))\n"
@@ -377,9 +398,8 @@ solve()
         result = await runner._run_test_case(solution, task.test_cases[0], task)
         assert result["success"] is True
 
-    async def test_stdin_ignores_invalid_function_name(self, tmp_path):
-        task = _make_stdin_task(tmp_path)
-        runner = _make_runner(tmp_path, task)
+    async def test_stdin_ignores_invalid_function_name(self, stdin_runner):
+        task, runner = stdin_runner
         test_case = {
             "testtype": "stdin",
             "function_name": "not; a; function",
@@ -431,6 +451,7 @@ solve()
 
         async def wrapped_create(*args, **kwargs):
             captured["preexec_fn"] = kwargs.get("preexec_fn")
+            captured["start_new_session"] = kwargs.get("start_new_session")
             return await original_create(*args, **kwargs)
 
         monkeypatch.setattr(asyncio, "create_subprocess_exec", wrapped_create)
@@ -444,6 +465,7 @@ solve()
         assert result["success"] is True
         assert captured["preexec_fn"] is not None
         assert captured["preexec_fn"].__name__ == "_apply_test_process_resource_limits"
+        assert captured["start_new_session"] is True
 
     async def test_uses_sandbox_manager_when_available(self, tmp_path):
         task = _make_task(tmp_path)
@@ -603,15 +625,7 @@ solve()
 
         bdir = tmp_path / "benchmarks"
         bdir.mkdir(exist_ok=True)
-        cfg = {
-            "name": task.name,
-            "description": task.description,
-            "task_prompt": task.task_prompt,
-            "test_cases": task.test_cases,
-            "timeout": task.timeout,
-            "scoring_method": task.scoring_method,
-        }
-        (bdir / f"{task.name}.yaml").write_text(yaml.dump(cfg))
+        (bdir / f"{task.name}.yaml").write_text(_ADD_TASK_YAML)
 
         runner = BenchmarkRunner(
             benchmarks_dir=str(bdir),
@@ -723,11 +737,26 @@ class TestBenchmarkScorer:
         score = scorer.score(actual, expected, {})
         assert 0.0 < score < 1.0
 
+    def test_json_scorer_accepts_parsed_dicts(self):
+        scorer = JsonScorer(partial_credit=True)
+        actual, expected = '{"a": 1, "b": 2}', '{"a": 1, "b": 99}'
+        assert scorer.score(json.loads(actual), json.loads(expected), {}) == (
+            scorer.score(actual, expected, {})
+        )
+
     def test_json_scorer_perfect_match(self):
         scorer = JsonScorer()
         s = '{"x": 10}'
         assert scorer.score(s, s, {}) == 1.0
 
+    def test_json_scorer_keeps_stdlib_number_semantics(self):
+        scorer = JsonScorer()
+        assert scorer.score('{"x": NaN, "y": Infinity}', '{"y": Infinity}', {}) == 1.0
+        assert scorer.score('{"y": 1e400}', '{"y": Infinity}', {}) == 1.0
+        big = '{"n": 123456789012345678901234567890}'
+        assert scorer.score(big, '{"n": 123456789012345678901234567891}', {}) == 0.0
+        assert scorer.score(big, big, {}) == 1.0
+
     def test_function_output_scorer_single(self):
         scorer = FunctionOutputScorer()
         assert scorer.score("3", "3", {}) == 1.0
@@ -738,6 +767,17 @@ class TestBenchmarkScorer:
         s = scorer.get_scorer({})
         assert isinstance(s, BinaryScorer)
 
+    @pytest.mark.parametrize("method, scorer_cls", [
+        ("binary", BinaryScorer),
+        ("partial", PartialCreditScorer),
+        ("json", JsonScorer),
+        ("function", FunctionOutputScorer),
+        ("unknown", BinaryScorer),
+    ])
+    def test_benchmark_scorer_dispatches_on_method(self, method, scorer_cls):
+        s = BenchmarkScorer().get_scorer({"scoring": {"method": method, "strict": False}})
+        assert type(s) is scorer_cls
+
 
 # ---------------------------------------------------------------------------
 # AgentValidator tests
@@ -811,24 +851,36 @@ class Agent:
 '''
 
 
-class TestAgentValidator:
+@pytest.fixture(scope="module")
+def validator():
+    """Host-only validator; it keeps no per-agent state between calls."""
+    return AgentValidator()
 
-    async def test_valid_agent_file_passes(self, tmp_path):
-        f = tmp_path / "agent.py"
+
+@pytest.fixture(scope="module")
+def minimal_agent_file(tmpfs_root):
+    """MINIMAL_AGENT on disk, written once for tests that only read it."""
+    with tempfile.TemporaryDirectory(dir=tmpfs_root, prefix="dgm_") as path:
+        f = Path(path) / "agent.py"
         f.write_text(MINIMAL_AGENT)
-        validator = AgentValidator()
+        yield f
+
+
+class TestAgentValidator:
+
+    async def test_valid_agent_file_passes(self, validator, minimal_agent_file):
+        f = minimal_agent_file
         result = await validator.validate_agent(str(f))
         assert result["valid"] is True, f"Errors: {result['errors']}"
 
-    async def test_syntax_error_fails(self, tmp_path):
+    async def test_syntax_error_fails(self, tmp_path, validator):
         f = tmp_path / "agent.py"
         f.write_text(BROKEN_SYNTAX_AGENT)
-        validator = AgentValidator()
         result = await validator.validate_agent(str(f))
         assert result["valid"] is False
         assert any("Syntax" in e or "syntax" in e for e in result["errors"])
 
-    async def test_no_agent_class_warns_but_passes(self, tmp_path):
+    async def test_no_agent_class_warns_but_passes(self, tmp_path, validator):
         """
         Production note: validator treats a missing Agent class as a WARNING,
         not an error (valid=True). This is a known limitation — the validator
@@ -836,37 +888,31 @@ class TestAgentValidator:
         """
         f = tmp_path / "agent.py"
         f.write_text(NO_AGENT_CLASS)
-        validator = AgentValidator()
         result = await validator.validate_agent(str(f))
         # Current production behaviour: no-Agent-class yields warnings only
         assert any("Agent" in w for w in result["warnings"])
 
-    async def test_missing_file_fails(self, tmp_path):
-        validator = AgentValidator()
+    async def test_missing_file_fails(self, tmp_path, validator):
         result = await validator.validate_agent(str(tmp_path / "ghost.py"))
         # _validate_structure will fail because suffix is .py but file doesn't exist
         # OR _validate_syntax will fail when trying to read it
         assert result["valid"] is False
 
-    async def test_prompt_build_failure_fails_validation(self, tmp_path):
+    async def test_prompt_build_failure_fails_validation(self, tmp_path, validator):
         f = tmp_path / "agent.py"
         f.write_text(BROKEN_PROMPT_AGENT)
-        validator = AgentValidator()
         result = await validator.validate_agent(str(f))
         assert result["valid"] is False
         assert any("prompt-build smoke failed" in e for e in result["errors"])
 
-    async def test_non_py_file_fails(self, tmp_path):
+    async def test_non_py_file_fails(self, tmp_path, validator):
         f = tmp_path / "agent.txt"
         f.write_text("hello")
-        validator = AgentValidator()
         result = await validator.validate_agent(str(f))
         assert result["valid"] is False
 
-    async def test_validation_summary_is_string(self, tmp_path):
-        f = tmp_path / "agent.py"
-        f.write_text(MINIMAL_AGENT)
-        validator = AgentValidator()
+    async def test_validation_summary_is_string(self, validator, minimal_agent_file):
+        f = minimal_agent_file
         result = await validator.validate_agent(str(f))
         summary = validator.get_validation_summary(result)
         assert isinstance(summary, str)
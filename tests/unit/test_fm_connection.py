@@ -5,10 +5,9 @@ No real API calls — all network is monkeypatched.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 
 from agent.fm_interface.api_handler import (
-    Message, MessageRole, CompletionRequest, CompletionResponse, ToolCall
+    Message, MessageRole, CompletionRequest
 )
 from agent.fm_interface.providers.anthropic import AnthropicHandler
 from agent.fm_interface.message_formatter import MessageFormatter
@@ -86,18 +85,21 @@ class TestAnthropicHandlerFormat:
         assert len(rest) == 1
         assert rest[0].role == MessageRole.USER
 
-    async def test_get_completion_raises_api_error_on_failure(self):
+    async def test_get_completion_raises_api_error_on_failure(self, monkeypatch):
         """A failed API call should raise ApiError (not leak the raw exception)."""
         from agent.fm_interface.api_handler import ApiError
 
+        async def failing_create(**kwargs):
+            raise Exception("boom")
+
         h = _make_handler()
-        with patch.object(h.client.messages, "create", side_effect=Exception("boom")):
-            request = CompletionRequest(
-                messages=[Message(role=MessageRole.USER, content="hi")],
-                max_tokens=10,
-            )
-            with pytest.raises(ApiError):
-                await h.get_completion(request)
+        monkeypatch.setattr(h.client.messages, "create", failing_create)
+        request = CompletionRequest(
+            messages=[Message(role=MessageRole.USER, content="hi")],
+            max_tokens=10,
+        )
+        with pytest.raises(ApiError):
+            await h.get_completion(request)
 
     def test_validate_config_missing_key_raises(self):
         with pytest.raises(ValueError):
@@ -4,26 +4,32 @@ and AnthropicHandler formatting logic.
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock
 
 from agent.fm_interface.api_handler import (
-    ApiHandler, Message, MessageRole, CompletionRequest,
-    CompletionResponse, ToolCall, MessageRole
+    ApiHandler, Message, MessageRole
 )
 from agent.fm_interface.providers.anthropic import AnthropicHandler
-from agent.fm_interface.message_formatter import MessageFormatter, ConversationContext
+from agent.fm_interface.message_formatter import MessageFormatter
 
 
-def _handler(model="claude-sonnet-4-6"):
+@pytest.fixture(scope="module")
+def handler():
+    """Formatting is stateless, so one handler (and its client) serves the module."""
     return AnthropicHandler({
         "api_key": "sk-ant-dummy",
-        "model": model,
+        "model": "claude-sonnet-4-6",
         "max_tokens": 512,
         "temperature": 0.0,
         "timeout": 10,
     })
 
 
+@pytest.fixture(scope="module")
+def fmt():
+    """MessageFormatter keeps only its default context list; safe to share."""
+    return MessageFormatter()
+
+
 class TestApiHandlerAbstract:
 
     def test_api_handler_is_abstract(self):
@@ -33,23 +39,20 @@ class TestApiHandlerAbstract:
 
 class TestAnthropicHandlerFormatMessages:
 
-    def test_user_message_role(self):
-        h = _handler()
+    def test_user_message_role(self, handler):
         msgs = [Message(role=MessageRole.USER, content="hello")]
-        out = h.format_messages(msgs)
+        out = handler.format_messages(msgs)
         assert out[0]["role"] == "user"
 
-    def test_assistant_message_with_no_tool_calls(self):
-        h = _handler()
+    def test_assistant_message_with_no_tool_calls(self, handler):
         msgs = [
             Message(role=MessageRole.USER, content="go"),
             Message(role=MessageRole.ASSISTANT, content="done", metadata=None),
         ]
-        out = h.format_messages(msgs)
+        out = handler.format_messages(msgs)
         assert out[-1]["role"] == "assistant"
 
-    def test_assistant_message_with_tool_calls(self):
-        h = _handler()
+    def test_assistant_message_with_tool_calls(self, handler):
         msgs = [
             Message(
                 role=MessageRole.ASSISTANT,
@@ -61,16 +64,15 @@ class TestAnthropicHandlerFormatMessages:
                 },
             )
         ]
-        out = h.format_messages(msgs)
+        out = handler.format_messages(msgs)
         content_blocks = out[0]["content"]
         assert isinstance(content_blocks, list)
         tool_use_blocks = [b for b in content_blocks if b.get("type") == "tool_use"]
         assert len(tool_use_blocks) == 1
         assert tool_use_blocks[0]["name"] == "bash"
 
-    def test_tool_result_message_merged(self):
+    def test_tool_result_message_merged(self, handler):
         """Consecutive TOOL messages → single user message."""
-        h = _handler()
         msgs = [
             Message(
                 role=MessageRole.TOOL,
@@ -83,34 +85,31 @@ class TestAnthropicHandlerFormatMessages:
                 metadata={"tool_use_id": "toolu_02"},
             ),
         ]
-        out = h.format_messages(msgs)
+        out = handler.format_messages(msgs)
         assert len(out) == 1
         assert out[0]["role"] == "user"
 
-    def test_consecutive_user_messages_merged(self):
+    def test_consecutive_user_messages_merged(self, handler):
         """Two consecutive USER messages should be merged into one."""
-        h = _handler()
         msgs = [
             Message(role=MessageRole.USER, content="line1"),
             Message(role=MessageRole.USER, content="line2"),
         ]
-        out = h.format_messages(msgs)
+        out = handler.format_messages(msgs)
         assert len(out) == 1
         assert out[0]["role"] == "user"
 
-    def test_system_extracted_not_in_messages(self):
-        h = _handler()
+    def test_system_extracted_not_in_messages(self, handler):
         sys_msg = Message(role=MessageRole.SYSTEM, content="system prompt")
         user_msg = Message(role=MessageRole.USER, content="question")
-        system_text, rest = h._extract_system([sys_msg, user_msg])
+        system_text, rest = handler._extract_system([sys_msg, user_msg])
         assert system_text == "system prompt"
         assert all(m.role != MessageRole.SYSTEM for m in rest)
 
 
 class TestAnthropicHandlerFormatTools:
 
-    def test_format_tools_adds_input_schema(self):
-        h = _handler()
+    def test_format_tools_adds_input_schema(self, handler):
         tools = [{
             "name": "edit",
             "description": "Edit files",
@@ -120,27 +119,23 @@ class TestAnthropicHandlerFormatTools:
                 "required": ["action"],
             }
         }]
-        formatted = h.format_tools(tools)
+        formatted = handler.format_tools(tools)
         assert formatted[0]["input_schema"]["type"] == "object"
 
-    def test_format_tools_empty_list(self):
-        h = _handler()
-        assert h.format_tools([]) == []
+    def test_format_tools_empty_list(self, handler):
+        assert handler.format_tools([]) == []
 
 
 class TestMessageFormatter:
 
-    def test_format_task_message_contains_description(self):
-        fmt = MessageFormatter()
+    def test_format_task_message_contains_description(self, fmt):
         msg = fmt.format_task_message("Solve X", None, [], [])
         assert "Solve X" in msg.content
 
-    def test_format_task_message_role_is_user(self):
-        fmt = MessageFormatter()
+    def test_format_task_message_role_is_user(self, fmt):
         msg = fmt.format_task_message("task", None, [], [])
         assert msg.role == MessageRole.USER
 
-    def test_format_task_message_with_constraints(self):
-        fmt = MessageFormatter()
+    def test_format_task_message_with_constraints(self, fmt):
         msg = fmt.format_task_message("task", None, ["no global vars"], [])
         assert "no global vars" in msg.content or isinstance(msg.content, str)
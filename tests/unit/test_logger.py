@@ -0,0 +1,33 @@
+"""
+Unit tests for utils.logger.
+"""
+
+import logging
+
+from utils.logger import setup_logger
+
+
+def test_setup_logger_reuses_handlers_for_same_settings():
+    logger = setup_logger("dgm.test_logger_reuse", level=logging.WARNING)
+    handlers = list(logger.handlers)
+
+    assert setup_logger("dgm.test_logger_reuse", level=logging.WARNING) is logger
+    assert logger.handlers == handlers
+
+    setup_logger("dgm.test_logger_reuse", level=logging.DEBUG)
+    assert logger.level == logging.DEBUG
+    assert len(logger.handlers) == 1
+    assert logger.handlers[0] is not handlers[0]
+    assert logger.handlers[0].formatter is handlers[0].formatter
+
+
+def test_setup_logger_rebinds_console_after_stdout_swap(monkeypatch):
+    import io
+    import sys
+
+    setup_logger("dgm.test_logger_stdout", level=logging.WARNING)
+    replacement = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", replacement)
+
+    logger = setup_logger("dgm.test_logger_stdout", level=logging.WARNING)
+    assert logger.handlers[0].stream is replacement
@@ -1,5 +1,4 @@
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
 
 import asyncio
 import httpx
@@ -28,6 +27,25 @@ def _handler(**overrides):
     return OpenAICompatibleHandler(config)
 
 
+def _stub_create(monkeypatch, h, *outcomes):
+    """Script h's chat.completions.create; returns the kwargs of each call.
+
+    Each call returns the next outcome, or raises it if it is an exception.
+    """
+    calls = []
+    pending = iter(outcomes)
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        outcome = next(pending)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(h.client.chat.completions, "create", create)
+    return calls
+
+
 def test_format_messages_preserves_openai_tool_call_shape():
     h = _handler()
 
@@ -249,97 +267,83 @@ def test_parse_response_repairs_prose_wrapped_tool_arguments():
     }
 
 
-async def test_get_completion_preserves_zero_temperature_and_extra_body():
+async def test_get_completion_preserves_zero_temperature_and_extra_body(monkeypatch):
     h = _handler(extra_body={"reasoning": {"enabled": True}})
     fake_response = {
         "model": "test/model",
         "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
     }
+    calls = _stub_create(monkeypatch, h, fake_response)
 
-    with patch.object(
-        h.client.chat.completions,
-        "create",
-        new_callable=AsyncMock,
-        return_value=fake_response,
-    ) as mock_create:
-        request = CompletionRequest(
-            messages=[Message(role=MessageRole.USER, content="hi")],
-            max_tokens=12,
-            temperature=0.0,
-        )
-        parsed = await h.get_completion(request)
+    request = CompletionRequest(
+        messages=[Message(role=MessageRole.USER, content="hi")],
+        max_tokens=12,
+        temperature=0.0,
+    )
+    parsed = await h.get_completion(request)
 
     assert parsed.content == "ok"
-    mock_create.assert_awaited_once()
-    kwargs = mock_create.await_args.kwargs
+    assert len(calls) == 1
+    kwargs = calls[0]
     assert kwargs["temperature"] == 0.0
     assert kwargs["max_tokens"] == 12
     assert kwargs["extra_body"] == {"reasoning": {"enabled": True}}
 
 
-async def test_get_completion_forwards_required_tool_choice():
+async def test_get_completion_forwards_required_tool_choice(monkeypatch):
     h = _handler()
     fake_response = {
         "model": "test/model",
         "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
     }
+    calls = _stub_create(monkeypatch, h, fake_response)
 
-    with patch.object(
-        h.client.chat.completions,
-        "create",
-        new_callable=AsyncMock,
-        return_value=fake_response,
-    ) as mock_create:
-        await h.get_completion(CompletionRequest(
-            messages=[Message(role=MessageRole.USER, content="write")],
-            tools=[{
-                "name": "edit",
-                "description": "Edit files",
-                "parameters": {"type": "object", "properties": {}},
-            }],
-            tool_choice="required",
-        ))
+    await h.get_completion(CompletionRequest(
+        messages=[Message(role=MessageRole.USER, content="write")],
+        tools=[{
+            "name": "edit",
+            "description": "Edit files",
+            "parameters": {"type": "object", "properties": {}},
+        }],
+        tool_choice="required",
+    ))
 
-    assert mock_create.await_args.kwargs["tool_choice"] == "required"
+    assert calls[-1]["tool_choice"] == "required"
 
 
-async def test_get_completion_retries_configured_timeout_once():
+async def test_get_completion_retries_configured_timeout_once(monkeypatch):
     h = _handler(timeout=1, timeout_retries=1, timeout_retry_delay=0)
     fake_response = {
         "model": "test/model",
         "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
     }
+    calls = _stub_create(monkeypatch, h, asyncio.TimeoutError(), fake_response)
 
-    with patch.object(
-        h.client.chat.completions,
-        "create",
-        new_callable=AsyncMock,
-        side_effect=[asyncio.TimeoutError(), fake_response],
-    ) as mock_create:
-        request = CompletionRequest(
-            messages=[Message(role=MessageRole.USER, content="hi")],
-        )
-        parsed = await h.get_completion(request)
+    request = CompletionRequest(
+        messages=[Message(role=MessageRole.USER, content="hi")],
+    )
+    parsed = await h.get_completion(request)
 
     assert parsed.content == "ok"
-    assert mock_create.await_count == 2
+    assert len(calls) == 2
 
 
-async def test_get_completion_enforces_outer_timeout():
+async def test_get_completion_enforces_outer_timeout(monkeypatch):
     h = _handler(timeout=0.01)
 
     async def slow_create(**kwargs):
-        await asyncio.sleep(1)
+        # Never resolves; only the handler's timeout can end the call.
+        await asyncio.get_running_loop().create_future()
 
-    with patch.object(h.client.chat.completions, "create", side_effect=slow_create):
-        request = CompletionRequest(
-            messages=[Message(role=MessageRole.USER, content="hi")],
-        )
-        with pytest.raises(ApiError, match="timed out after"):
-            await h.get_completion(request)
+    monkeypatch.setattr(h.client.chat.completions, "create", slow_create)
+    request = CompletionRequest(
+        messages=[Message(role=MessageRole.USER, content="hi")],
+    )
+    with pytest.raises(ApiError, match="timed out after"):
+        await h.get_completion(request)
 
 
-async def test_get_completion_preserves_provider_status_response(caplog):
+async def test_get_completion_preserves_provider_status_response(caplog, monkeypatch):
     h = _handler(model="google/gemini-3.5-flash")
     response = httpx.Response(
         400,
@@ -355,17 +359,13 @@ async def test_get_completion_preserves_provider_status_response(caplog):
         },
     )
 
-    with patch.object(
-        h.client.chat.completions,
-        "create",
-        new_callable=AsyncMock,
-        side_effect=status_error,
-    ):
-        request = CompletionRequest(
-            messages=[Message(role=MessageRole.USER, content="hi")],
-        )
-        with pytest.raises(ApiError) as raised:
-            await h.get_completion(request)
+    _stub_create(monkeypatch, h, status_error)
+
+    request = CompletionRequest(
+        messages=[Message(role=MessageRole.USER, content="hi")],
+    )
+    with pytest.raises(ApiError) as raised:
+        await h.get_completion(request)
 
     assert raised.value.status_code == 400
     assert "Unsupported request parameter" in str(raised.value)
@@ -6,9 +6,10 @@ introduced by the fixer) and the ModificationProposer / PerformanceDiagnosis
 modules that are still live.
 """
 
+import ast
+import shutil
+
 import pytest
-import asyncio
-from pathlib import Path
 
 from self_modification.implementation import ImplementationManager
 from self_modification.modification_proposal import (
@@ -182,6 +183,46 @@ class TestImplementationManagerDelete:
         assert "keep this" in content
 
 
+class TestImplementationManagerBackup:
+
+    def test_backup_is_independent_copy(self, tmp_path):
+        agent_dir = tmp_path / "agent"
+        (agent_dir / "tools").mkdir(parents=True)
+        (agent_dir / "agent.py").write_text("x = 1\n")
+        (agent_dir / "tools" / "empty.py").write_text("")
+        backup = ImplementationManager()._create_backup(str(agent_dir))
+        try:
+            (agent_dir / "agent.py").write_text("x = 2\n")
+            assert (backup / "agent" / "agent.py").read_text() == "x = 1\n"
+            assert (backup / "agent" / "tools" / "empty.py").read_text() == ""
+        finally:
+            shutil.rmtree(backup, ignore_errors=True)
+
+
+class TestImplementationManagerVerify:
+
+    async def test_verify_parses_each_file_once(self, tmp_path, monkeypatch):
+        """Syntax and import checks share one parse per file."""
+        (tmp_path / "mod.py").write_text("import os\nx = 1\n")
+        parsed = []
+        real_parse = ast.parse
+
+        def counting_parse(source, *args, **kwargs):
+            parsed.append(kwargs.get("filename"))
+            return real_parse(source, *args, **kwargs)
+
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        results = await ImplementationManager()._verify_modifications(str(tmp_path))
+        assert results['valid'] is True
+        assert parsed == [str(tmp_path / "mod.py")]
+
+    async def test_verify_reports_unresolvable_import(self, tmp_path):
+        (tmp_path / "mod.py").write_text("import dgm_no_such_module_xyz\n")
+        results = await ImplementationManager()._verify_modifications(str(tmp_path))
+        assert results['valid'] is False
+        assert any("dgm_no_such_module_xyz" in e for e in results['errors'])
+
+
 # ---------------------------------------------------------------------------
 # PerformanceDiagnosis
 # ---------------------------------------------------------------------------
@@ -208,6 +249,23 @@ class TestPerformanceDiagnosis:
         # High score → fewer / no critical issues
         assert isinstance(report.improvement_suggestions, list)
 
+    def test_benchmark_failures_tally_timeouts_and_repeated_errors(self):
+        diagnoser = PerformanceDiagnosis()
+        report = DiagnosisReport(overall_score=0.2, benchmark_scores={})
+        test_results = (
+            [{"passed": False, "error": "Timeout after 10s"}] * 2
+            + [{"passed": False, "error": "KeyError"}] * 2
+            + [{"passed": True, "error": None}]
+        )
+        diagnoser._analyze_benchmark_failures(
+            {"detailed_results": {"math": {"test_results": test_results}}}, report
+        )
+        assert report.timeout_patterns == ["math: 2 timeouts detected"]
+        assert report.error_handling_issues == [
+            "math: Repeated error - Timeout after 10s (2 times)",
+            "math: Repeated error - KeyError (2 times)",
+        ]
+
 
 # ---------------------------------------------------------------------------
 # ModificationProposer
@@ -8,18 +8,29 @@ import json
 import asyncio
 import os
 import pytest
-import shutil
-import tempfile
 from pathlib import Path
 
 from agent.tools.base_tool import (
-    BaseTool, ToolRegistry, ToolResult, ToolExecutionStatus, ToolParameter
+    BaseTool, ToolRegistry, ToolResult, ToolExecutionStatus
 )
 from agent.tools.bash_tool import BashTool
 from agent.tools.edit_tool import EditTool
 from sandbox.sandbox_manager import SandboxResult
 
 
+# Fake sandbox payloads, encoded once at import rather than per call.
+_SANDBOX_WRITE_OUTPUT = json.dumps({
+    "status": "success",
+    "output": "Successfully wrote from_sandbox.txt",
+    "error": "",
+})
+_SANDBOX_DELETE_OUTPUT = json.dumps({
+    "status": "success",
+    "output": "Successfully deleted delete_me.txt",
+    "error": "",
+})
+
+
 # ---------------------------------------------------------------------------
 # BaseTool / ToolRegistry
 # ---------------------------------------------------------------------------
@@ -60,6 +71,13 @@ class TestToolRegistry:
         assert schema["name"] == "test_tool"
         assert "parameters" in schema
 
+    def test_tool_schema_built_once(self):
+        tool = BashTool()
+        assert tool.get_tool_schema() is tool.get_tool_schema()
+        registry = ToolRegistry()
+        registry.register_tool(tool)
+        assert registry.get_tool_schemas()[0] is tool.get_tool_schema()
+
     async def test_tool_registry_rejects_unknown_parameters(self):
         registry = ToolRegistry()
         registry.register_tool(ConcreteTestTool())
@@ -111,12 +129,64 @@ class TestBashTool:
         result = await self.tool.execute({"command": "echo hello"})
         assert result.status == ToolExecutionStatus.SUCCESS
         assert "hello" in result.output
+        assert result.metadata == {"exit_code": 0}
+
+    async def test_max_output_bytes_stops_unbounded_output(self):
+        result = await self.tool.execute({
+            "command": "yes",
+            "timeout": 5,
+            "max_output_bytes": 4096,
+        })
+        assert result.status == ToolExecutionStatus.SUCCESS
+        assert len(result.output) == 4096
+        assert result.output.startswith("y\ny\n")
+        assert result.metadata["output_truncated"] is True
+
+    async def test_max_output_bytes_exact_size_is_not_truncated(self):
+        result = await self.tool.execute({
+            "command": "printf abc",
+            "max_output_bytes": 3,
+        })
+        assert result.status == ToolExecutionStatus.SUCCESS
+        assert result.output == "abc"
+        assert result.metadata == {"exit_code": 0}
+
+    async def test_max_output_bytes_drains_chatty_stderr(self):
+        result = await self.tool.execute({
+            "command": "head -c 200000 /dev/zero >&2",
+            "timeout": 5,
+            "max_output_bytes": 4096,
+        })
+        assert result.status == ToolExecutionStatus.SUCCESS
+        assert result.output == ""
+        assert len(result.error) == 4096
+        assert result.metadata == {"exit_code": 0, "stderr_truncated": True}
+
+    async def test_max_output_bytes_must_be_positive(self):
+        result = await self.tool.execute({"command": "echo hi", "max_output_bytes": 0})
+        assert result.status == ToolExecutionStatus.INVALID_PARAMS
 
     async def test_echo_special_chars(self):
         result = await self.tool.execute({"command": "echo 'foo bar baz'"})
         assert result.status == ToolExecutionStatus.SUCCESS
         assert "foo bar baz" in result.output
 
+    async def test_literal_echo_skips_shell_spawn(self, monkeypatch):
+        async def no_spawn(*args, **kwargs):
+            raise AssertionError("literal echo should not start a shell")
+
+        monkeypatch.setattr(asyncio, "create_subprocess_shell", no_spawn)
+        result = await self.tool.execute({"command": "echo 'a  b' c"})
+        assert result.status == ToolExecutionStatus.SUCCESS
+        assert result.output == "a  b c\n"
+        assert result.metadata == {"exit_code": 0}
+
+    async def test_echo_with_glob_runs_in_shell(self):
+        Path(self.wd, "found.txt").write_text("")
+        result = await self.tool.execute({"command": "echo *.txt"})
+        assert result.status == ToolExecutionStatus.SUCCESS
+        assert result.output == "found.txt\n"
+
     async def test_failed_command_returns_error(self):
         result = await self.tool.execute({"command": "ls /nonexistent_xyz_path_999"})
         assert result.status == ToolExecutionStatus.ERROR
@@ -130,6 +200,14 @@ class TestBashTool:
         assert result.status == ToolExecutionStatus.TIMEOUT
         assert "timed out" in (result.error or "").lower() or "timeout" in (result.error or "").lower()
 
+    async def test_timeout_kills_sleep_with_output_cap(self):
+        result = await self.tool.execute({
+            "command": "sleep 30",
+            "timeout": 1,
+            "max_output_bytes": 4096,
+        })
+        assert result.status == ToolExecutionStatus.TIMEOUT
+
     async def test_empty_command_invalid_params(self):
         result = await self.tool.execute({"command": ""})
         assert result.status == ToolExecutionStatus.INVALID_PARAMS
@@ -183,8 +261,12 @@ class TestBashTool:
         assert "Pattern '|'" in (result.error or "")
 
     async def test_blocked_commands_rejected(self):
-        for cmd in ["sudo ls", "kill 1", "rm -rf /"]:
-            result = await self.tool.execute({"command": cmd})
+        commands = ["sudo ls", "kill 1", "rm -rf /"]
+        # The checks are independent, so run them concurrently.
+        results = await asyncio.gather(
+            *(self.tool.execute({"command": cmd}) for cmd in commands)
+        )
+        for cmd, result in zip(commands, results):
             assert result.status == ToolExecutionStatus.ERROR, (
                 f"Expected blocked command to fail: {cmd}"
             )
@@ -210,7 +292,7 @@ class TestBashTool:
         monkeypatch.setattr(asyncio, "create_subprocess_shell", wrapped_create)
 
         tool = BashTool(working_directory=str(tmp_path), timeout=5)
-        result = await tool.execute({"command": "echo limited"})
+        result = await tool.execute({"command": "printf limited"})
 
         assert result.status == ToolExecutionStatus.SUCCESS
         if os.name == "posix":
@@ -936,11 +1018,7 @@ class TestEditTool:
                 })
                 return SandboxResult(
                     success=True,
-                    output=json.dumps({
-                        "status": "success",
-                        "output": "Successfully wrote from_sandbox.txt",
-                        "error": "",
-                    }),
+                    output=_SANDBOX_WRITE_OUTPUT,
                     exit_code=0,
                     execution_time=0.1,
                 )
@@ -988,11 +1066,7 @@ class TestEditTool:
                 Path(workspace_path, "delete_me.txt").unlink()
                 return SandboxResult(
                     success=True,
-                    output=json.dumps({
-                        "status": "success",
-                        "output": "Successfully deleted delete_me.txt",
-                        "error": "",
-                    }),
+                    output=_SANDBOX_DELETE_OUTPUT,
                     exit_code=0,
                     execution_time=0.1,
                 )
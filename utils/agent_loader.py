@@ -6,13 +6,20 @@ Abstracts away the complexity of Python path management and imports.
 import sys
 import importlib.util
 from pathlib import Path
-from typing import Optional, Any, Type
+from typing import Dict, Optional, Any, Tuple, Type
 import logging
 
 
 class AgentLoader:
     """Manages agent loading with proper module resolution."""
     
+    logger = logging.getLogger(__name__)
+    
+    # Agent classes loaded from the archive, keyed by (resolved agent.py
+    # path, mtime_ns, size). Shared across loaders: archived agents are
+    # written once, so re-executing the module would build the same class.
+    _archive_class_cache: Dict[Tuple[str, int, int], Type[Any]] = {}
+    
     def __init__(self, project_root: Optional[Path] = None):
         """
         Initialize AgentLoader.
@@ -21,7 +28,7 @@ class AgentLoader:
             project_root: Root directory of the project. Defaults to current working directory.
         """
         self.project_root = project_root or Path.cwd()
-        self.logger = logging.getLogger(__name__)
+        self._project_root_str = str(self.project_root)
         
     def setup_environment(self, agent_dir: Path) -> None:
         """
@@ -31,15 +38,16 @@ class AgentLoader:
             agent_dir: Directory containing the agent file
         """
         # Add project root to Python path
-        if str(self.project_root) not in sys.path:
-            sys.path.insert(0, str(self.project_root))
-            self.logger.debug(f"Added project root to sys.path: {self.project_root}")
+        root_str = self._project_root_str
+        if root_str not in sys.path:
+            sys.path.insert(0, root_str)
+            self.logger.debug("Added project root to sys.path: %s", self.project_root)
             
         # Add agent directory if it's from archive
-        agent_parent = agent_dir.parent
-        if "archive" in str(agent_parent) and str(agent_parent) not in sys.path:
-            sys.path.insert(0, str(agent_parent))
-            self.logger.debug(f"Added archive directory to sys.path: {agent_parent}")
+        agent_parent = str(agent_dir.parent)
+        if "archive" in agent_parent and agent_parent not in sys.path:
+            sys.path.insert(0, agent_parent)
+            self.logger.debug("Added archive directory to sys.path: %s", agent_parent)
             
     def load_from_archive(self, agent_path: Path) -> Type[Any]:
         """
@@ -55,9 +63,17 @@ class AgentLoader:
             ImportError: If the agent module cannot be loaded
             AttributeError: If the Agent class is not found in the module
         """
-        self.setup_environment(agent_path.parent)
-        
         try:
+            # A missing or unreadable agent.py is logged like any other
+            # load failure.
+            st = agent_path.stat()
+            cache_key = (str(agent_path.resolve()), st.st_mtime_ns, st.st_size)
+            cached = self._archive_class_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            self.setup_environment(agent_path.parent)
+            
             # Create a unique module name to avoid conflicts
             module_name = f"archived_agent_{agent_path.parent.name}"
             
@@ -75,16 +91,30 @@ class AgentLoader:
             spec.loader.exec_module(module)
             
             # Get the Agent class
-            if not hasattr(module, 'Agent'):
+            agent_class = getattr(module, 'Agent', None)
+            if agent_class is None:
                 raise AttributeError(f"No Agent class found in {agent_path}")
                 
-            self.logger.info(f"Successfully loaded agent from {agent_path}")
-            return module.Agent
+            self.logger.info("Successfully loaded agent from %s", agent_path)
+            self._archive_class_cache[cache_key] = agent_class
+            return agent_class
             
         except Exception as e:
-            self.logger.error(f"Failed to load agent from {agent_path}: {e}")
+            self.logger.error("Failed to load agent from %s: %s", agent_path, e)
             raise
             
+    @classmethod
+    def invalidate(cls, agent_path: Path) -> None:
+        """
+        Drop cached archive classes for an agent.py path.
+        
+        Args:
+            agent_path: Path to the agent.py file whose entries to forget
+        """
+        resolved = str(Path(agent_path).resolve())
+        for key in [k for k in cls._archive_class_cache if k[0] == resolved]:
+            del cls._archive_class_cache[key]
+            
     def load_from_path(self, agent_file: Path) -> Type[Any]:
         """
         Load an Agent class from an arbitrary agent.py file path.
@@ -138,10 +168,10 @@ class AgentLoader:
             agent_class = self._find_agent_class(module, mod_name)
             if agent_class is None:
                 raise AttributeError(f"No Agent class found in {agent_file}")
-            self.logger.info(f"Successfully loaded agent from {agent_file}")
+            self.logger.info("Successfully loaded agent from %s", agent_file)
             return agent_class
         except Exception as e:
-            self.logger.error(f"Failed to load agent from {agent_file}: {e}")
+            self.logger.error("Failed to load agent from %s: %s", agent_file, e)
             raise
 
     @staticmethod
@@ -190,14 +220,18 @@ class AgentLoader:
             return Agent
             
         except Exception as e:
-            self.logger.error(f"Failed to load agent from source: {e}")
+            self.logger.error("Failed to load agent from source: %s", e)
             raise
             
     def cleanup_paths(self) -> None:
         """Clean up any paths added to sys.path during loading."""
         # Remove any archive paths we added
-        paths_to_remove = [p for p in sys.path if "archive" in p and p != str(self.project_root)]
-        for path in paths_to_remove:
-            if path in sys.path:
-                sys.path.remove(path)
-                self.logger.debug(f"Removed from sys.path: {path}")
\ No newline at end of file
+        root_str = self._project_root_str
+        kept = []
+        for path in sys.path:
+            if "archive" in path and path != root_str:
+                self.logger.debug("Removed from sys.path: %s", path)
+            else:
+                kept.append(path)
+        # One rebuild in place instead of a scan-and-shift per removed entry.
+        sys.path[:] = kept
\ No newline at end of file
@@ -1,11 +1,56 @@
 """Configuration loader with environment variable support."""
 
+import copy
 import os
+import re
+import time
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
+# Per file version (resolved path, mtime_ns, size, inode): the raw text, the
+# ${VAR} names it references, their values at parse time, and the parsed
+# config. Bounded LRU.
+_CacheEntry = Tuple[str, Tuple[str, ...], Tuple[Optional[str], ...], Dict[str, Any]]
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int, int], _CacheEntry]" = OrderedDict()
+_CONFIG_CACHE_MAX_ENTRIES = 100
+
+# Files modified more recently than this are re-read on every load: a
+# same-size rewrite within the filesystem's mtime granularity would keep
+# an identical stat signature (git's "racy" index problem).
+_CONFIG_CACHE_RACE_WINDOW_NS = 2_000_000_000
+
+# Safe YAML loader, C-accelerated when PyYAML has libyaml.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# ${VAR_NAME} placeholders substituted from the environment.
+_ENV_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Set once the repo .env (or .env.example) has been applied to os.environ.
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once() -> None:
+    """Load the repo's .env file into the environment, once per process."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
+    
+    # Load .env file if it exists — resolve relative to repo root, not CWD
+    _repo_root = Path(__file__).resolve().parents[1]
+    env_path = _repo_root / ".env"
+    if env_path.exists():
+        load_dotenv(env_path)
+    else:
+        # Try .env.example as fallback (for testing)
+        env_example_path = _repo_root / ".env.example"
+        if env_example_path.exists():
+            load_dotenv(env_example_path)
+
+
 class ConfigLoader:
     """Loads configuration from YAML files with environment variable substitution."""
     
@@ -16,33 +61,48 @@ class ConfigLoader:
             config_path: Path to the configuration file
         """
         self.config_path = Path(config_path)
-        
-        # Load .env file if it exists — resolve relative to repo root, not CWD
-        _repo_root = Path(__file__).resolve().parents[1]
-        env_path = _repo_root / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
-        else:
-            # Try .env.example as fallback (for testing)
-            env_example_path = _repo_root / ".env.example"
-            if env_example_path.exists():
-                load_dotenv(env_example_path)
+        _load_dotenv_once()
     
     def load(self) -> Dict[str, Any]:
         """Load configuration with environment variable substitution.
         
+        Placeholders are substituted into the raw text before parsing, so an
+        env value such as ``4096`` or ``true`` becomes a typed scalar. The
+        parsed config is cached per file version and per value of the
+        variables it references, so variables set later are picked up. Each
+        call returns a fresh copy the caller may mutate.
+        
         Returns:
             Dictionary containing the configuration
         """
-        with open(self.config_path, 'r') as f:
-            config_text = f.read()
-        
-        # Substitute environment variables
-        config_text = self._substitute_env_vars(config_text)
+        return copy.deepcopy(self._load_shared())
+    
+    def _load_shared(self) -> Dict[str, Any]:
+        """Return the cached parsed config itself; callers must not mutate it."""
+        st = self.config_path.stat()
+        key = (str(self.config_path.resolve()), st.st_mtime_ns, st.st_size, st.st_ino)
+        entry = _CONFIG_CACHE.get(key)
+        if entry is not None:
+            text, names, env_values, config = entry
+            current_values = tuple(os.environ.get(name) for name in names)
+            if current_values == env_values:
+                _CONFIG_CACHE.move_to_end(key)
+                return config
+        else:
+            with open(self.config_path, 'r') as f:
+                text = f.read()
+            names = tuple(dict.fromkeys(_ENV_PATTERN.findall(text)))
+            current_values = tuple(os.environ.get(name) for name in names)
         
-        # Parse YAML
-        config = yaml.safe_load(config_text)
+        # Skip the substitution pass for the common placeholder-free file.
+        substituted = self._substitute_env_vars(text) if names else text
+        config = yaml.load(substituted, Loader=_YAML_SAFE_LOADER)
         
+        if time.time_ns() - st.st_mtime_ns > _CONFIG_CACHE_RACE_WINDOW_NS:
+            _CONFIG_CACHE[key] = (text, names, current_values, config)
+            _CONFIG_CACHE.move_to_end(key)
+            if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+                _CONFIG_CACHE.popitem(last=False)
         return config
     
     def _substitute_env_vars(self, text: str) -> str:
@@ -54,16 +114,10 @@ class ConfigLoader:
         Returns:
             Text with substituted values
         """
-        import re
-        
-        def replace_var(match):
-            var_name = match.group(1)
-            value = os.environ.get(var_name, f"${{{var_name}}}")
-            return value
-        
-        # Replace ${VAR_NAME} patterns
-        pattern = r'\$\{([^}]+)\}'
-        return re.sub(pattern, replace_var, text)
+        # Unset variables keep their placeholder text unchanged.
+        return _ENV_PATTERN.sub(
+            lambda match: os.environ.get(match.group(1), match.group(0)), text
+        )
     
     def get_fm_config(self, provider: str) -> Dict[str, Any]:
         """Get Foundation Model provider configuration.
@@ -74,8 +128,9 @@ class ConfigLoader:
         Returns:
             Provider configuration dictionary
         """
-        config = self.load()
-        fm_config = config.get('fm_providers', {}).get(provider, {})
+        # Copy only the requested provider's section, not the whole config.
+        config = self._load_shared()
+        fm_config = copy.deepcopy(config.get('fm_providers', {}).get(provider, {}))
         
         # Check if API key is properly set
         api_key = fm_config.get('api_key', '')
@@ -90,9 +145,25 @@ class ConfigLoader:
         Returns:
             Primary provider name
         """
-        config = self.load()
+        config = self._load_shared()
         return config.get('fm_providers', {}).get('primary', 'gemini')
 
 
-# Global config loader instance
-config_loader = ConfigLoader()
\ No newline at end of file
+# Global config loader instance, built on first use so importing this module
+# does not load .env files.
+_config_loader = None
+
+
+def get_config_loader() -> ConfigLoader:
+    """Return the process-wide ConfigLoader, creating it on first call."""
+    global _config_loader
+    if _config_loader is None:
+        _config_loader = ConfigLoader()
+    return _config_loader
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps `from utils.config_loader import config_loader` working lazily.
+    if name == "config_loader":
+        return get_config_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
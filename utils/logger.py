@@ -4,9 +4,16 @@ Logging utilities for the Darwin Gödel Machine.
 
 import logging
 import sys
+import time
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+
+# Formatters are stateless, so one per format string is shared by all handlers.
+_FORMATTER_CACHE: Dict[str, logging.Formatter] = {}
+
+# (level, log_file, format_string) each logger was last set up with.
+_CONFIGURED: Dict[str, Tuple[int, Optional[str], str]] = {}
 
 
 def setup_logger(
@@ -30,14 +37,26 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
-    # Clear existing handlers
-    logger.handlers.clear()
-    
     # Default format
     if format_string is None:
         format_string = '[%(asctime)s] %(levelname)-8s %(name)s - %(message)s'
     
-    formatter = logging.Formatter(format_string)
+    # Already set up identically, not cleared since, and still writing to
+    # the current sys.stdout (which tests and redirects swap): keep it.
+    settings = (level, log_file, format_string)
+    if (
+        _CONFIGURED.get(name) == settings
+        and logger.handlers
+        and getattr(logger.handlers[0], "stream", None) is sys.stdout
+    ):
+        return logger
+    
+    # Clear existing handlers
+    logger.handlers.clear()
+    
+    formatter = _FORMATTER_CACHE.get(format_string)
+    if formatter is None:
+        formatter = _FORMATTER_CACHE[format_string] = logging.Formatter(format_string)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -55,12 +74,13 @@ def setup_logger(
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
+    _CONFIGURED[name] = settings
     return logger
 
 
 def get_timestamp() -> str:
     """Get a formatted timestamp string."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return time.strftime("%Y-%m-%d %H:%M:%S")
 
 
 def log_exception(logger: logging.Logger, exception: Exception, context: str = ""):
@@ -72,11 +92,10 @@ def log_exception(logger: logging.Logger, exception: Exception, context: str = "
         exception: Exception to log
         context: Additional context message
     """
-    import traceback
-    
     if context:
-        logger.error(f"{context}: {type(exception).__name__}: {str(exception)}")
+        logger.error("%s: %s: %s", context, type(exception).__name__, exception)
     else:
-        logger.error(f"{type(exception).__name__}: {str(exception)}")
+        logger.error("%s: %s", type(exception).__name__, exception)
     
-    logger.debug(f"Traceback:\n{traceback.format_exc()}")
\ No newline at end of file
+    # The handler formats the traceback only if a DEBUG record is emitted.
+    logger.debug("Traceback:", exc_info=exception)
\ No newline at end of file